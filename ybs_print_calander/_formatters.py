@@ -0,0 +1,109 @@
+"""Output formatters used by the command line interface.
+
+Kept separate from :mod:`ybs_print_calander.cli` so the CLI only imports them
+once orders have actually been retrieved.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence, TextIO
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .client import OrderRecord
+
+
+_TABLE_HEADERS = ("Order#", "Company")
+
+
+def format_table(orders: Sequence[OrderRecord]) -> str:
+    headers = _TABLE_HEADERS
+    w0, w1 = (len(header) for header in headers)
+
+    # Measure and unpack each record in one pass so the rows below are
+    # rendered from plain tuples without touching the attributes again.
+    rows: list[tuple[str, str]] = []
+    append_row = rows.append
+    for order in orders:
+        order_number = order.order_number
+        company = order.company
+        if len(order_number) > w0:
+            w0 = len(order_number)
+        if len(company) > w1:
+            w1 = len(company)
+        append_row((order_number, company))
+
+    divider = "+" + "-" * (w0 + 2) + "+" + "-" * (w1 + 2) + "+"
+
+    # One f-string per row beats a precomputed "{:^N}" template, and "^" would
+    # also place the odd padding space differently than str.center does.
+    lines = [
+        divider,
+        f"| {headers[0].center(w0)} | {headers[1].center(w1)} |",
+        divider,
+    ]
+    lines += [
+        f"| {order_number.center(w0)} | {company.center(w1)} |"
+        for order_number, company in rows
+    ]
+    lines.append(divider)
+    return "\n".join(lines)
+
+
+_CSV_BATCH_ROWS = 1024
+
+
+class _ListWriter:
+    """File-like sink that collects ``csv.writer`` output lines in a list."""
+
+    __slots__ = ("buf",)
+
+    def __init__(self) -> None:
+        self.buf: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.buf.append(text)
+        return len(text)
+
+
+def write_orders_csv(orders: Sequence[OrderRecord], handle: TextIO) -> None:
+    import csv
+
+    # csv.writer issues one write() per row, which is a syscall per line on
+    # a line-buffered terminal. Render rows into a list and hand them to the
+    # destination in batches instead.
+    sink = _ListWriter()
+    writer = csv.writer(sink)
+    writer.writerow(("order_number", "company"))
+    for start in range(0, len(orders), _CSV_BATCH_ROWS):
+        # OrderRecord is a NamedTuple, so each record already is a CSV row.
+        writer.writerows(orders[start : start + _CSV_BATCH_ROWS])
+        handle.writelines(sink.buf)
+        sink.buf.clear()
+    if sink.buf:
+        handle.writelines(sink.buf)
+
+
+def format_orders_json(orders: Sequence[OrderRecord]) -> str:
+    payload = [
+        {"order_number": order.order_number, "company": order.company}
+        for order in orders
+    ]
+
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        orjson = None
+
+    # The output has always escaped non-ASCII characters and DEL as \uXXXX so
+    # it is safe on any console encoding; orjson writes both as raw UTF-8.
+    # It is only used when no string contains either, where the two agree.
+    if orjson is not None and all(
+        text.isascii() and "\x7f" not in text
+        for order in orders
+        for text in (order.order_number, order.company)
+    ):
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    import json
+
+    return json.dumps(payload, indent=2)
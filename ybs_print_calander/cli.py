@@ -2,75 +2,33 @@
 
 from __future__ import annotations
 
-import argparse
-import csv
-import json
 import os
 import sys
-from getpass import getpass
-from io import StringIO
-from typing import Iterable, Sequence
+from typing import TYPE_CHECKING, Iterable, Sequence, TextIO
 
-from .client import AuthenticationError, NetworkError, OrderRecord, YBSClient
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import argparse
+
+# ``requests``/``bs4`` (via ``.client``), ``argparse`` and the output helpers
+# are imported lazily so common invocations only pay for what they use.
+
+FORMAT_CHOICES = ("table", "csv", "json")
+_OUTPUT_BUFFER_SIZE = 1 << 20
 
 
 def _prompt_for_missing(value: str | None, prompt: str, secret: bool = False) -> str:
     if value:
         return value
     if secret:
+        from getpass import getpass
+
         return getpass(prompt)
     return input(prompt)
 
 
-def _format_table(orders: Sequence[OrderRecord]) -> str:
-    headers = ("Order#", "Company")
-    column_widths = [len(header) for header in headers]
-
-    for order in orders:
-        column_widths[0] = max(column_widths[0], len(order.order_number))
-        column_widths[1] = max(column_widths[1], len(order.company))
-
-    divider = "+".join("-" * (width + 2) for width in column_widths)
-    divider = f"+{divider}+"
-
-    header_line = "|".join(
-        f" {header.center(width)} " for header, width in zip(headers, column_widths)
-    )
-    header_line = f"|{header_line}|"
-
-    lines = [divider, header_line, divider]
-
-    for order in orders:
-        row_line = "|".join(
-            (
-                f" {order.order_number.center(column_widths[0])} ",
-                f" {order.company.center(column_widths[1])} ",
-            )
-        )
-        lines.append(f"|{row_line}|")
-
-    lines.append(divider)
-    return "\n".join(lines)
-
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse
 
-def _format_orders_csv(orders: Sequence[OrderRecord]) -> str:
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(["order_number", "company"])
-    for order in orders:
-        writer.writerow([order.order_number, order.company])
-    return buffer.getvalue()
-
-
-def _format_orders_json(orders: Sequence[OrderRecord]) -> str:
-    payload = [
-        {"order_number": order.order_number, "company": order.company}
-        for order in orders
-    ]
-    return json.dumps(payload, indent=2)
-
-
-def main(argv: Iterable[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="YBS Print Calander CLI")
     parser.add_argument(
         "--username",
@@ -95,7 +53,7 @@ def main(argv: Iterable[str] | None = None) -> int:
     )
     parser.add_argument(
         "--format",
-        choices=("table", "csv", "json"),
+        choices=FORMAT_CHOICES,
         default="table",
         help="Format used to display orders (default: table)",
     )
@@ -104,14 +62,90 @@ def main(argv: Iterable[str] | None = None) -> int:
         metavar="FILE",
         help="Write the formatted orders to FILE instead of standard output",
     )
+    return parser
+
+
+class _ParsedArgs:
+    """Options recognised by :func:`_parse_argv`, named like argparse's."""
+
+    __slots__ = ("username", "password", "no_prompt", "format", "output")
+
+    def __init__(self) -> None:
+        self.username: str | None = None
+        self.password: str | None = None
+        self.no_prompt = False
+        self.format = "table"
+        self.output: str | None = None
+
+
+_VALUE_OPTIONS = {
+    "-u": "username",
+    "--username": "username",
+    "-p": "password",
+    "--password": "password",
+    "--format": "format",
+    "--output": "output",
+}
+
+
+def _parse_argv(argv: Sequence[str]) -> _ParsedArgs | None:
+    """Parse the common argument shapes without importing argparse.
+
+    Returns ``None`` for anything else (``--help``, abbreviated options,
+    invalid values, ...) so the caller can defer to :func:`_build_parser`,
+    which owns the help text and error messages.
+    """
+
+    args = _ParsedArgs()
+    index = 0
+    count = len(argv)
+    while index < count:
+        token = argv[index]
+        index += 1
+        if token == "--no-prompt":
+            args.no_prompt = True
+            continue
+
+        name, separator, value = token.partition("=")
+        if separator and name in _VALUE_OPTIONS:
+            option = _VALUE_OPTIONS[name]
+        elif token in _VALUE_OPTIONS:
+            option = _VALUE_OPTIONS[token]
+            if index >= count or argv[index].startswith("-"):
+                return None
+            value = argv[index]
+            index += 1
+        elif token[:2] in ("-u", "-p") and len(token) > 2 and not separator:
+            option = _VALUE_OPTIONS[token[:2]]
+            value = token[2:]
+        else:
+            return None
+
+        if option == "format" and value not in FORMAT_CHOICES:
+            return None
+        setattr(args, option, value)
+    return args
 
-    args = parser.parse_args(list(argv) if argv is not None else None)
+
+def main(argv: Iterable[str] | None = None) -> int:
+    if argv is None:
+        arguments: Sequence[str] = sys.argv[1:]
+    elif isinstance(argv, (list, tuple)):
+        # Both parsers only read the sequence, so there is no need to copy it.
+        arguments = argv
+    else:
+        arguments = list(argv)
+    parser: argparse.ArgumentParser | None = None
+    args = _parse_argv(arguments)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(arguments)
 
     username = args.username or os.environ.get("YBS_USERNAME")
     password = args.password or os.environ.get("YBS_PASSWORD")
 
     if args.no_prompt and (not username or not password):
-        parser.error(
+        (parser or _build_parser()).error(
             "--no-prompt requires both --username and --password to be provided or "
             "for YBS_USERNAME/YBS_PASSWORD to be set"
         )
@@ -121,6 +155,8 @@ def main(argv: Iterable[str] | None = None) -> int:
     if not password and not args.no_prompt:
         password = _prompt_for_missing(password, "Password: ", secret=True)
 
+    from .client import AuthenticationError, NetworkError, YBSClient
+
     client = YBSClient()
 
     try:
@@ -145,24 +181,36 @@ def main(argv: Iterable[str] | None = None) -> int:
         print("No orders were returned from the manage page.")
         return 0
 
+    from ._formatters import format_orders_json, format_table, write_orders_csv
+
     formatters = {
-        "table": _format_table,
-        "csv": _format_orders_csv,
-        "json": _format_orders_json,
+        "table": format_table,
+        "json": format_orders_json,
     }
-    payload = formatters[args.format](orders)
+
+    def emit(handle: TextIO) -> None:
+        # CSV is streamed straight to the destination; the other formats are
+        # small enough to render as a single string first.
+        if args.format == "csv":
+            write_orders_csv(orders, handle)
+            return
+        payload = formatters[args.format](orders)
+        if not payload.endswith("\n"):
+            payload += "\n"
+        handle.write(payload)
 
     if args.output:
         try:
-            with open(args.output, "w", encoding="utf-8") as handle:
-                handle.write(payload)
-                if payload and not payload.endswith("\n"):
-                    handle.write("\n")
+            with open(
+                args.output, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE
+            ) as handle:
+                emit(handle)
         except OSError as exc:
             print(f"Failed to write output to {args.output!r}: {exc}", file=sys.stderr)
             return 3
     else:
-        print(payload)
+        emit(sys.stdout)
+        sys.stdout.flush()
     return 0
 
 
@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 import re
-from typing import Iterable, List, Optional
+import time
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+try:  # Optional C-backed parser; BeautifulSoup is used when it is missing.
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_etree = None
+    lxml_html = None
+    DESCENDANT_TEXT_XPATH = None
+else:
+    DESCENDANT_TEXT_XPATH = lxml_etree.XPath(".//text()")
+
+
+ORDER_NUMBER_PATTERN = re.compile(r"\b(\d+)\b")
+DETAILS_CLASS_PATTERN = re.compile(r"\bdetails\b")
+# Matched against raw response bytes so the body never has to be decoded just
+# to tell whether the server bounced us back to the sign-in form.
+SIGNIN_MARKER_PATTERN = re.compile(rb'(?:id|name)="signin"', re.IGNORECASE)
+# Bytes carried between streamed chunks so a marker split across two chunks
+# is still found (one less than the longest marker, ``name="signin"``).
+SIGNIN_MARKER_OVERLAP = len(b'name="signin"') - 1
+# The sign-in form sits near the top of the login page, so only this many
+# leading bytes are checked; an authenticated manage page is never scanned in
+# full just to prove the marker is absent.
+SIGNIN_SCAN_LIMIT = 32 * 1024
+STREAM_CHUNK_SIZE = 16 * 1024
 
 
 class YBSError(Exception):
@@ -22,8 +49,7 @@ class NetworkError(YBSError):
     """Raised when the remote service cannot be reached."""
 
 
-@dataclass
-class OrderRecord:
+class OrderRecord(NamedTuple):
     """Represents a single order entry scraped from the manage page."""
 
     order_number: str
@@ -35,13 +61,36 @@ class YBSClient:
 
     LOGIN_URL = "https://www.ybsnow.com/index.php"
     MANAGE_URL = "https://www.ybsnow.com/manage.html"
+    # How long the manage page downloaded while verifying a login may be
+    # reused by the following ``fetch_orders`` call.
+    MANAGE_PAGE_REUSE_SECONDS = 5.0
 
     def __init__(self, session: Optional[requests.Session] = None) -> None:
-        self.session = session or requests.Session()
+        self.session = session or self._create_session()
         self.session.headers.setdefault(
             "User-Agent",
             "YBS Print Calander/1.0 (+https://www.ybsnow.com/)",
         )
+        self._verified_manage_page: Optional[Tuple[float, requests.Response]] = None
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Return a session tuned for the handful of requests made to one host."""
+
+        session = requests.Session()
+        # Every request goes to the same host, so a small keep-alive pool is
+        # enough. Up to two retries with a short backoff: failures to connect
+        # are retried for every method, the login POST included, since the
+        # request was never sent; read errors are only retried for idempotent
+        # methods, and no status codes trigger a retry.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def login(self, username: str, password: str) -> bool:
         """Attempt to authenticate with the YBS website.
@@ -58,6 +107,8 @@ class YBSClient:
             NetworkError: If the network request cannot be completed.
         """
 
+        self._verified_manage_page = None
+
         payload = {
             "email": username,
             "password": password,
@@ -77,52 +128,198 @@ class YBSClient:
         except requests.RequestException as exc:  # pragma: no cover - defensive
             raise NetworkError("Failed to verify login with the manage page.") from exc
 
-        if self._is_login_page(manage_response.text):
+        if self._is_login_page(manage_response.content):
             raise AuthenticationError("Login failed. Please verify your username and password.")
 
+        # Keep the response rather than its text: it is only decoded if the
+        # next fetch_orders() call actually reuses it.
+        self._verified_manage_page = (time.monotonic(), manage_response)
         return True
 
     def fetch_orders(self) -> List[OrderRecord]:
-        """Fetch and parse the orders from the manage page."""
+        """Fetch and parse the orders from the manage page.
+
+        Directly after a successful :meth:`login` the manage page downloaded to
+        verify the credentials is parsed instead of being requested again.
+        """
 
+        verified_page = self._verified_manage_page
+        self._verified_manage_page = None
+        if verified_page is not None:
+            verified_at, manage_response = verified_page
+            if time.monotonic() - verified_at <= self.MANAGE_PAGE_REUSE_SECONDS:
+                return list(self._parse_orders(manage_response.text))
+
+        stream = lxml_html is not None
         try:
-            response = self.session.get(self.MANAGE_URL, timeout=10)
+            response = self.session.get(self.MANAGE_URL, timeout=10, stream=stream)
             response.raise_for_status()
         except requests.RequestException as exc:  # pragma: no cover - defensive
             raise NetworkError("Failed to retrieve the orders page.") from exc
 
-        if self._is_login_page(response.text):
+        if stream:
+            with response:
+                try:
+                    return self._stream_orders(response)
+                except requests.RequestException as exc:  # pragma: no cover - defensive
+                    raise NetworkError("Failed to retrieve the orders page.") from exc
+
+        if self._is_login_page(response.content):
             raise AuthenticationError("Cannot fetch orders without logging in first.")
 
         return list(self._parse_orders(response.text))
 
-    def _is_login_page(self, html: str) -> bool:
-        lowered = html.lower()
-        return "id=\"signin\"" in lowered or "name=\"signin\"" in lowered
+    def _stream_orders(self, response: requests.Response) -> List[OrderRecord]:
+        """Incrementally parse a streamed manage page with lxml.
+
+        Rows are handed to the parser chunk by chunk and discarded once they
+        have been converted, so neither the decoded body nor the full DOM is
+        kept in memory.
+        """
+
+        parser = lxml_etree.HTMLPullParser(
+            events=("end",), tag="tr", encoding=response.encoding
+        )
+        orders: List[OrderRecord] = []
+        head = bytearray()
+
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            if not chunk:
+                continue
+            if len(head) < SIGNIN_SCAN_LIMIT:
+                # Only the new bytes (plus enough overlap for a marker split
+                # across chunks) need searching.
+                start = max(len(head) - SIGNIN_MARKER_OVERLAP, 0)
+                head += chunk
+                if SIGNIN_MARKER_PATTERN.search(head, start, SIGNIN_SCAN_LIMIT):
+                    raise AuthenticationError("Cannot fetch orders without logging in first.")
+            parser.feed(chunk)
+            orders.extend(self._drain_streamed_rows(parser))
+
+        try:
+            parser.close()
+        except lxml_etree.LxmlError:
+            # An empty body has no document to close; there is nothing to parse.
+            pass
+        orders.extend(self._drain_streamed_rows(parser))
+        return orders
+
+    def _drain_streamed_rows(
+        self, parser: "lxml_etree.HTMLPullParser"
+    ) -> Iterable[OrderRecord]:
+        for _, row in parser.read_events():
+            # Nested rows are handled with their outermost row so records keep
+            # document order, matching the non-streaming parsers.
+            if next(row.iterancestors("tr"), None) is not None:
+                continue
+
+            parse_row = self._parse_row_lxml
+            for nested_row in row.iter("tr"):
+                record = parse_row(nested_row)
+                if record is not None:
+                    yield record
+
+            row.clear(keep_tail=True)
+            parent = row.getparent()
+            if parent is not None:
+                while row.getprevious() is not None:
+                    del parent[0]
+
+    def _is_login_page(self, body: bytes) -> bool:
+        return SIGNIN_MARKER_PATTERN.search(body, 0, SIGNIN_SCAN_LIMIT) is not None
 
     def _parse_orders(self, html: str) -> Iterable[OrderRecord]:
+        if lxml_html is not None:
+            return self._parse_orders_lxml(html)
+        return self._parse_orders_bs4(html)
+
+    def _parse_orders_lxml(self, html: str) -> Iterable[OrderRecord]:
+        try:
+            document = lxml_html.fromstring(html)
+        except (ValueError, lxml_etree.LxmlError):
+            # Empty documents and ones lxml rejects go through html.parser.
+            yield from self._parse_orders_bs4(html)
+            return
+
+        parse_row = self._parse_row_lxml
+        for row in document.iter("tr"):
+            record = parse_row(row)
+            if record is not None:
+                yield record
+
+    def _parse_row_lxml(self, row: "lxml_html.HtmlElement") -> Optional[OrderRecord]:
+        search_details = DETAILS_CLASS_PATTERN.search
+        move_cell = None
+        details_cell = None
+        for cell in row.iter("td"):
+            classes = cell.get("class") or ""
+            if move_cell is None and "move" in classes.split():
+                move_cell = cell
+            if details_cell is None and search_details(classes):
+                details_cell = cell
+        if move_cell is None or details_cell is None:
+            return None
+
+        move_text = " ".join(
+            text.strip() for text in DESCENDANT_TEXT_XPATH(move_cell) if text.strip()
+        )
+        match = ORDER_NUMBER_PATTERN.search(move_text)
+        if match is None:
+            return None
+        company = self._extract_company_lxml(details_cell)
+
+        if company:
+            return OrderRecord(order_number=match.group(1), company=company)
+        return None
+
+    def _parse_orders_bs4(self, html: str) -> Iterable[OrderRecord]:
         soup = BeautifulSoup(html, "html.parser")
 
+        # Bind the per-row helpers once; this loop runs for every table row.
+        find = Tag.find
+        search_number = ORDER_NUMBER_PATTERN.search
+        details_pattern = DETAILS_CLASS_PATTERN
+        extract_company = self._extract_company
+        cell_text = self._cell_text
+
         for row in soup.find_all("tr"):
-            move_cell = row.find("td", class_="move")
-            details_cell = row.find("td", class_=re.compile(r"\bdetails\b"))
+            move_cell = find(row, "td", class_="move")
+            details_cell = find(row, "td", class_=details_pattern)
             if move_cell is None or details_cell is None:
                 continue
 
-            order_number = self._extract_order_number(move_cell.get_text(" ", strip=True))
-            company = self._extract_company(details_cell)
+            match = search_number(cell_text(move_cell, " "))
+            if match is None:
+                continue
+            company = extract_company(details_cell)
 
-            if order_number and company:
-                yield OrderRecord(order_number=order_number, company=company)
+            if company:
+                yield OrderRecord(order_number=match.group(1), company=company)
 
-    def _extract_order_number(self, text: str) -> Optional[str]:
-        match = re.search(r"\b(\d+)\b", text)
-        if match:
-            return match.group(1)
-        return None
+    @staticmethod
+    def _cell_text(tag: Tag, separator: str = "") -> str:
+        """Return ``tag.get_text(separator, strip=True)``, cheaply when possible.
+
+        Most cells wrap a single text node, which ``Tag.string`` hands back
+        without walking the subtree. Anything else (mixed content, comments,
+        CDATA) goes through ``get_text`` so the result is unchanged.
+        """
+
+        text = tag.string
+        if type(text) is NavigableString:
+            return text.strip()
+        return tag.get_text(separator, strip=True)
 
     def _extract_company(self, cell: Tag) -> Optional[str]:
         first_paragraph = cell.find("p")
         if first_paragraph:
-            return first_paragraph.get_text(strip=True)
-        return cell.get_text(strip=True) or None
+            return self._cell_text(first_paragraph)
+        return self._cell_text(cell) or None
+
+    def _extract_company_lxml(self, cell: "lxml_html.HtmlElement") -> Optional[str]:
+        first_paragraph = cell.find(".//p")
+        source = first_paragraph if first_paragraph is not None else cell
+        text = "".join(part.strip() for part in DESCENDANT_TEXT_XPATH(source))
+        if first_paragraph is not None:
+            return text
+        return text or None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import calendar
 import datetime as dt
+import functools
 import json
 import os
 import queue
@@ -11,11 +12,18 @@ import re
 import subprocess
 import sys
 import threading
+import time
 import tkinter as tk
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from tkinter import messagebox, ttk
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+try:  # Optional C-backed JSON codec for the state file.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from . import __version__
 from .client import AuthenticationError, NetworkError, OrderRecord, YBSClient
@@ -53,74 +61,267 @@ ABOUT_MESSAGE = (
 )
 
 DRAG_THRESHOLD = 5
+# Pointer travel, in pixels, an active drag needs before it is redrawn.
+DRAG_MOTION_THRESHOLD = 4
+# Interval, roughly one frame, over which drag motion events are coalesced.
+DRAG_MOTION_INTERVAL_MS = 16
+SHIFT_MASK = 0x0001
+# Control, plus Command (reported as Mod2) on macOS.
+CONTROL_MASK = 0x0014 if sys.platform == "darwin" else 0x0004
+# How long an enumerated monitor layout is trusted before it is queried again.
+MONITOR_LIST_CACHE_SECONDS = 2.0
+# Delay before a burst of main window <Configure> events clears those caches.
+MONITOR_INVALIDATE_DELAY_MS = 200
+# Delay between the first unsaved edit and writing the state file.
+STATE_SAVE_DELAY_MS = 1000
+# Number of undo (and redo) steps kept before the oldest ones are dropped.
+MAX_HISTORY = 100
 
 DateKey = Tuple[int, int, int]
+# Root-relative (x, y, width, height) of the calendar grid, followed by the
+# day, frame and bounds of each visible day cell.
+CalendarGeometry = Tuple[
+    Tuple[int, int, int, int],
+    Tuple[Tuple[DateKey, tk.Misc, int, int, int, int], ...],
+]
 
 
+# Applied to the whole ``xrandr`` output at once, so whitespace is limited to
+# spaces and tabs to keep each match on a single line.
 XRANDR_MONITOR_PATTERN = re.compile(
-    r"^\s*\S+\s+connected(?:\s+primary)?\s+(?P<w>\d+)x(?P<h>\d+)\+(?P<x>-?\d+)\+(?P<y>-?\d+)",
-    re.IGNORECASE,
+    r"^[ \t]*\S+[ \t]+connected(?:[ \t]+primary)?[ \t]+"
+    r"(?P<w>\d+)x(?P<h>\d+)\+(?P<x>-?\d+)\+(?P<y>-?\d+)",
+    re.IGNORECASE | re.MULTILINE,
 )
 
 
 STATE_PATH = Path.home() / ".ybs_print_calander" / "state.json"
 
+DAY_ABBREVIATIONS = tuple(calendar.day_abbr)
+# Six weeks of seven days covers the longest month layout.
+CALENDAR_CELL_COUNT = 6 * 7
+NOTES_UNDO_BINDTAG = "YBSNotesUndo"
+_CALENDAR = calendar.Calendar()
+
+
+@functools.lru_cache(maxsize=64)
+def _month_weeks(year: int, month: int) -> Tuple[Tuple[dt.date, ...], ...]:
+    """Return the weeks (Monday first) covering ``month``, memoized per month."""
+
+    return tuple(
+        tuple(week) for week in _CALENDAR.monthdatescalendar(year, month)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _month_year_label(year: int, month: int) -> str:
+    return dt.date(year, month, 1).strftime("%B %Y")
+
+
+@functools.lru_cache(maxsize=None)
+def _win32_monitor_lookup() -> (
+    Callable[[int, int], tuple[int, int, int, int] | None] | None
+):
+    """Resolve the Win32 monitor API once; ``None`` when it is unavailable.
+
+    The returned callable maps a screen point to the ``(left, top, right,
+    bottom)`` rectangle of the nearest monitor.
+    """
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+    except Exception:
+        return None
+
+    MonitorFromPoint = getattr(user32, "MonitorFromPoint", None)
+    GetMonitorInfo = getattr(user32, "GetMonitorInfoW", None)
+    if not (MonitorFromPoint and GetMonitorInfo):
+        return None
+
+    MONITOR_DEFAULTTONEAREST = 2
+
+    class POINT(ctypes.Structure):
+        _fields_ = [
+            ("x", wintypes.LONG),
+            ("y", wintypes.LONG),
+        ]
+
+    class RECT(ctypes.Structure):
+        _fields_ = [
+            ("left", wintypes.LONG),
+            ("top", wintypes.LONG),
+            ("right", wintypes.LONG),
+            ("bottom", wintypes.LONG),
+        ]
+
+    class MONITORINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcMonitor", RECT),
+            ("rcWork", RECT),
+            ("dwFlags", wintypes.DWORD),
+        ]
+
+    def monitor_rect(x: int, y: int) -> tuple[int, int, int, int] | None:
+        monitor = MonitorFromPoint(POINT(x, y), MONITOR_DEFAULTTONEAREST)
+        if not monitor:
+            return None
+        info = MONITORINFO()
+        info.cbSize = ctypes.sizeof(info)
+        if not GetMonitorInfo(monitor, ctypes.byref(info)):
+            return None
+        rect = info.rcMonitor
+        left, top, right, bottom = (
+            int(rect.left),
+            int(rect.top),
+            int(rect.right),
+            int(rect.bottom),
+        )
+        if left < right and top < bottom:
+            return (left, top, right, bottom)
+        return None
+
+    return monitor_rect
+
+
+@functools.lru_cache(maxsize=None)
+def _screeninfo_get_monitors() -> Callable[[], Iterable[object]] | None:
+    """Return ``screeninfo.get_monitors`` if the optional package imports."""
+
+    try:
+        from screeninfo import get_monitors  # type: ignore
+    except Exception:
+        return None
+    return get_monitors
+
+
+@functools.lru_cache(maxsize=None)
+def _xlib_display() -> Any | None:
+    """Open one python-xlib connection with RandR support, if available."""
+
+    try:
+        from Xlib import display as xlib_display  # type: ignore
+
+        connection = xlib_display.Display()
+    except Exception:
+        return None
+    if not connection.has_extension("RANDR"):
+        connection.close()
+        return None
+    return connection
+
+
+def _xlib_randr_monitors() -> list[tuple[int, int, int, int]]:
+    """Return the geometry of every active CRTC using the RandR extension.
+
+    Empty when python-xlib is unavailable or the query fails, in which case
+    callers fall back to running ``xrandr``.
+    """
+
+    connection = _xlib_display()
+    if connection is None:
+        return []
+
+    monitors: list[tuple[int, int, int, int]] = []
+    try:
+        resources = connection.screen().root.xrandr_get_screen_resources_current()
+        for crtc in resources.crtcs:
+            info = connection.xrandr_get_crtc_info(crtc, resources.config_timestamp)
+            if not info.mode or info.width <= 0 or info.height <= 0:
+                continue
+            monitors.append((info.x, info.y, info.x + info.width, info.y + info.height))
+    except Exception:
+        return []
+    return monitors
+
 
 class HoverTooltip:
     """Display contextual hover text for a widget after a small delay."""
 
+    # A single timer is shared by every tooltip. Pointer motion only records
+    # which tooltip is pending and since when; the timer re-arms itself for
+    # whatever delay remains instead of being cancelled and re-created with
+    # ``after`` on each motion event.
+    _pending: HoverTooltip | None = None
+    _pending_since = 0.0
+    _timer_id: str | None = None
+
+    # Every tooltip shows its text in the same window, created on first use;
+    # ``_shared_owner`` is the tooltip currently displayed in it.
+    _shared_window: tk.Toplevel | None = None
+    _shared_label: tk.Label | None = None
+    _shared_owner: HoverTooltip | None = None
+
     def __init__(self, widget: tk.Widget, text: str, *, delay: int = 500) -> None:
         self.widget = widget
         self.text = text
         self.delay = delay
-        self._after_id: str | None = None
         self._pointer: tuple[int, int] | None = None
-        self._visible = False
         self._widget_destroyed = False
 
-        tooltip: tk.Toplevel | None
-        try:
-            tooltip = tk.Toplevel(widget.winfo_toplevel())
-        except tk.TclError:
-            tooltip = None
+        widget.bind("<Enter>", self._on_enter, add="+")
+        widget.bind("<Leave>", self._on_leave, add="+")
+        widget.bind("<Motion>", self._on_motion, add="+")
+        widget.bind("<ButtonPress>", self._on_leave, add="+")
+        widget.bind("<Destroy>", self._on_widget_destroy, add="+")
 
-        self._tooltip = tooltip
+    @property
+    def _visible(self) -> bool:
+        return HoverTooltip._shared_owner is self
 
-        if tooltip is not None:
-            tooltip.withdraw()
-            try:
-                tooltip.wm_overrideredirect(True)
-            except tk.TclError:
-                pass
-            try:
-                tooltip.transient(widget.winfo_toplevel())
-            except tk.TclError:
-                pass
+    @classmethod
+    def _get_shared_window(
+        cls, widget: tk.Widget
+    ) -> tuple[tk.Toplevel, tk.Label] | None:
+        window = cls._shared_window
+        label = cls._shared_label
+        if window is not None and label is not None:
             try:
-                tooltip.attributes("-topmost", True)
+                if window.winfo_exists():
+                    return (window, label)
             except tk.TclError:
                 pass
-            tooltip.configure(background=ACCENT_COLOR, padx=1, pady=1)
-
-            label = tk.Label(
-                tooltip,
-                text=text,
-                background=ACCENT_COLOR,
-                foreground=TEXT_COLOR,
-                borderwidth=0,
-                highlightthickness=0,
-                justify="left",
-                wraplength=280,
-                padx=10,
-                pady=6,
-            )
-            label.pack()
 
-        widget.bind("<Enter>", self._on_enter, add="+")
-        widget.bind("<Leave>", self._on_leave, add="+")
-        widget.bind("<Motion>", self._on_motion, add="+")
-        widget.bind("<ButtonPress>", self._on_leave, add="+")
-        widget.bind("<Destroy>", self._on_widget_destroy, add="+")
+        try:
+            root = widget.nametowidget(".")
+            window = tk.Toplevel(root)
+        except (tk.TclError, KeyError):
+            return None
+
+        window.withdraw()
+        try:
+            window.wm_overrideredirect(True)
+        except tk.TclError:
+            pass
+        try:
+            window.transient(root)
+        except tk.TclError:
+            pass
+        try:
+            window.attributes("-topmost", True)
+        except tk.TclError:
+            pass
+        window.configure(background=ACCENT_COLOR, padx=1, pady=1)
+
+        label = tk.Label(
+            window,
+            background=ACCENT_COLOR,
+            foreground=TEXT_COLOR,
+            borderwidth=0,
+            highlightthickness=0,
+            justify="left",
+            wraplength=280,
+            padx=10,
+            pady=6,
+        )
+        label.pack()
+
+        cls._shared_window = window
+        cls._shared_label = label
+        return (window, label)
 
     def _on_enter(self, event: tk.Event) -> None:
         self._pointer = self._event_pointer(event)
@@ -138,13 +339,6 @@ class HoverTooltip:
     def _on_widget_destroy(self, _: tk.Event | None) -> None:
         self._widget_destroyed = True
         self._hide()
-        tooltip = self._tooltip
-        if tooltip is not None:
-            try:
-                tooltip.destroy()
-            except tk.TclError:
-                pass
-            self._tooltip = None
 
     def _event_pointer(self, event: tk.Event) -> tuple[int, int]:
         x_root = getattr(event, "x_root", 0)
@@ -157,53 +351,80 @@ class HoverTooltip:
     def _schedule_show(self) -> None:
         if self._widget_destroyed:
             return
-        self._cancel_scheduled_show()
+        cls = HoverTooltip
+        cls._pending = self
+        cls._pending_since = time.monotonic()
+        if cls._timer_id is None:
+            cls._start_timer(self.widget, self.delay)
+
+    @classmethod
+    def _start_timer(cls, widget: tk.Widget, delay: int) -> None:
+        # Scheduled on the root window so the timer outlives the widget
+        # (and its registered Tcl commands) that happened to arm it.
         try:
-            self._after_id = self.widget.after(self.delay, self._show)
-        except tk.TclError:
-            self._after_id = None
+            root = widget.nametowidget(".")
+            cls._timer_id = root.after(max(delay, 1), cls._tick)
+        except (tk.TclError, KeyError):
+            cls._timer_id = None
 
-    def _cancel_scheduled_show(self) -> None:
-        if self._after_id is None:
+    @classmethod
+    def _tick(cls) -> None:
+        cls._timer_id = None
+        tooltip = cls._pending
+        if tooltip is None:
             return
-        try:
-            self.widget.after_cancel(self._after_id)
-        except tk.TclError:
-            pass
-        self._after_id = None
+        elapsed = (time.monotonic() - cls._pending_since) * 1000
+        remaining = int(tooltip.delay - elapsed)
+        if remaining > 0:
+            cls._start_timer(tooltip.widget, remaining)
+            return
+        cls._pending = None
+        tooltip._show()
+
+    def _cancel_scheduled_show(self) -> None:
+        if HoverTooltip._pending is self:
+            HoverTooltip._pending = None
 
     def _show(self) -> None:
-        self._after_id = None
-        if self._visible or self._tooltip is None or self._widget_destroyed:
+        if self._visible or self._widget_destroyed:
             return
         if not self.widget.winfo_exists():
             return
+        shared = self._get_shared_window(self.widget)
+        if shared is None:
+            return
+        window, label = shared
         try:
-            self._tooltip.deiconify()
-            self._tooltip.lift()
+            label.configure(text=self.text)
+            window.deiconify()
+            window.lift()
         except tk.TclError:
             return
-        self._visible = True
+        HoverTooltip._shared_owner = self
         self._reposition()
 
     def _hide(self) -> None:
         self._cancel_scheduled_show()
-        if not self._visible or self._tooltip is None:
+        if not self._visible:
+            return
+        HoverTooltip._shared_owner = None
+        window = HoverTooltip._shared_window
+        if window is None:
             return
         try:
-            self._tooltip.withdraw()
+            window.withdraw()
         except tk.TclError:
             pass
-        self._visible = False
 
     def _reposition(self) -> None:
-        if not self._visible or self._tooltip is None:
+        window = HoverTooltip._shared_window
+        if not self._visible or window is None:
             return
         if self._pointer is None:
             return
         x, y = self._pointer
         try:
-            self._tooltip.geometry(f"+{x + 16}+{y + 16}")
+            window.geometry(f"+{x + 16}+{y + 16}")
         except tk.TclError:
             pass
 
@@ -212,20 +433,144 @@ class HoverTooltip:
 class DayCell:
     """Container for widgets that make up a calendar day cell."""
 
+    __slots__ = (
+        "frame",
+        "header_label",
+        "notes_text",
+        "orders_list",
+        "default_bg",
+        "header_fg",
+        "notes_bg",
+        "notes_fg",
+        "orders_bg",
+        "orders_fg",
+        "border_color",
+        "border_thickness",
+        "is_today",
+        "in_current_month",
+    )
+
     frame: tk.Frame
     header_label: tk.Label
     notes_text: tk.Text
     orders_list: tk.Listbox
     default_bg: str
-    header_fg: str = TEXT_COLOR
-    notes_bg: str = NOTES_TEXT_BACKGROUND
-    notes_fg: str = TEXT_COLOR
-    orders_bg: str = ORDERS_LIST_BACKGROUND
-    orders_fg: str = TEXT_COLOR
-    border_color: str = ACCENT_COLOR
-    border_thickness: int = 1
-    is_today: bool = False
-    in_current_month: bool = True
+    header_fg: str
+    notes_bg: str
+    notes_fg: str
+    orders_bg: str
+    orders_fg: str
+    border_color: str
+    border_thickness: int
+    is_today: bool
+    in_current_month: bool
+
+
+@dataclass
+class DayDetailsDialog:
+    """Widgets of the reusable day details window.
+
+    ``size`` is the window's measured ``(width, height)``, or ``None`` until
+    it is first shown.
+    """
+
+    __slots__ = ("window", "date_label", "refresh_list", "size")
+
+    window: tk.Toplevel
+    date_label: ttk.Label
+    refresh_list: Callable[..., None]
+    size: Tuple[int, int] | None
+
+
+class DragState:
+    """Progress of dragging orders out of the tree or a day's listbox."""
+
+    __slots__ = (
+        "items",
+        "values",
+        "start_x",
+        "start_y",
+        "last_x",
+        "last_y",
+        "widget",
+        "widget_size",
+        "calendar_geometry",
+        "active",
+        "source",
+        "source_date_key",
+        "source_indices",
+        "source_assignments",
+        "selection_snapshot",
+        "selection_anchor",
+        "focus_item",
+        "active_index",
+        "clicked_item",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.items: Tuple[object, ...] = ()
+        self.values: Tuple[object, ...] = ()
+        self.start_x = 0
+        self.start_y = 0
+        self.last_x = 0
+        self.last_y = 0
+        self.widget: tk.Toplevel | None = None
+        self.widget_size: Tuple[int, int] | None = None
+        self.calendar_geometry: CalendarGeometry | None = None
+        self.active = False
+        self.source: str | None = None
+        self.source_date_key: DateKey | None = None
+        self.source_indices: Tuple[int, ...] = ()
+        self.source_assignments: Tuple[object, ...] = ()
+        self.selection_snapshot: Tuple[object, ...] = ()
+        self.selection_anchor: object | None = None
+        self.focus_item: str | None = None
+        self.active_index: int | None = None
+        self.clicked_item: str | None = None
+
+
+@dataclass
+class AssignmentsDiff:
+    """Assignments an edit removed from and added to a single day.
+
+    ``removed`` holds positions in the list before the edit and ``added``
+    positions in the list after it, both in ascending order, so the same
+    record can be replayed in either direction.
+    """
+
+    __slots__ = ("removed", "added")
+
+    removed: List[Tuple[int, Tuple[str, str]]]
+    added: List[Tuple[int, Tuple[str, str]]]
+
+
+@dataclass
+class AssignmentsAction:
+    """History entry changing the assignments of one or more days."""
+
+    __slots__ = ("dates",)
+
+    dates: Dict[DateKey, AssignmentsDiff]
+
+
+@dataclass
+class NotesAction:
+    """History entry restoring the notes of a single day.
+
+    ``previous`` is the empty string when the day had no notes.
+    """
+
+    __slots__ = ("date_key", "had_key", "previous")
+
+    date_key: DateKey
+    had_key: bool
+    previous: str
+
+
+HistoryAction = Union[AssignmentsAction, NotesAction]
 
 
 class YBSApp:
@@ -245,23 +590,70 @@ class YBSApp:
         self._current_month = today.month
 
         self._day_cells: Dict[DateKey, DayCell] = {}
+        # Day cell widgets map back to their date so every cell can share the
+        # same binding callbacks instead of per-cell closures.
+        self._widget_date_keys: Dict[tk.Misc, DateKey] = {}
+        # Days whose notes widget was edited since its text was last saved.
+        self._dirty_note_keys: set[DateKey] = set()
+        # Frame, header, notes and orders widgets of every day cell, created
+        # once and reused for each month shown.
+        self._day_cell_widgets: List[
+            Tuple[tk.Frame, tk.Label, tk.Text, tk.Listbox]
+        ] = []
+        # Options last applied to each day cell widget by
+        # _configure_cell_widget, used to skip redundant configure calls.
+        self._cell_widget_options: Dict[tk.Misc, Dict[str, object]] = {}
+        self._day_cell_bindings = self._create_day_cell_bindings()
         self._calendar_notes: Dict[DateKey, str] = {}
         self._calendar_assignments: Dict[DateKey, List[Tuple[str, str]]] = {}
         self._calendar_hover: DateKey | None = None
         self._day_cell_pointer_hover: DateKey | None = None
         self._active_day_header: DateKey | None = None
-        self._drag_data: dict[str, object] = {}
+        self._drag_data = DragState()
+        # Latest pointer position of a drag, handled by a pending after job.
+        self._drag_motion_xy: Tuple[int, int] | None = None
+        self._drag_motion_after_id: str | None = None
         self._tree_selection_anchor: str | None = None
+        # Rows of the orders tree in display order, and each row's position.
+        # Only _apply_order_filter changes the rows, and it rebuilds both.
+        self._tree_children: Tuple[str, ...] = ()
+        self._tree_child_index: Dict[str, int] = {}
         self._day_selection_anchor: Dict[DateKey, int] = {}
         self._state_path: Path = STATE_PATH
         self._state_path.parent.mkdir(parents=True, exist_ok=True)
         self._state_save_after_id: str | None = None
-        self._undo_stack: list[dict[str, Any]] = []
-        self._undo_stack_limit = 100
-        self._redo_stack: list[dict[str, Any]] = []
-        self._redo_stack_limit = self._undo_stack_limit
+        # The day details window is built on first use and then only hidden.
+        self._day_details_dialog: DayDetailsDialog | None = None
+        self._day_details_date_key: DateKey | None = None
+        # Day cells waiting for a coalesced refresh on the next idle pass.
+        self._pending_display_updates: set[DateKey] = set()
+        self._display_flush_after_id: str | None = None
+        # JSON-ready copies of the notes/assignments, refreshed per date key
+        # so a debounced save only re-serializes the days that changed.
+        self._serialized_notes: Dict[str, str] = {}
+        self._serialized_assignments: Dict[str, List[Tuple[str, str]]] = {}
+        self._dirty_date_keys: set[DateKey] = set()
+        self._state_needs_full_sync = True
+        # Encoding and writing happen on a worker thread; at most one write is
+        # in flight and a save requested meanwhile runs once it has finished.
+        self._state_save_thread: threading.Thread | None = None
+        self._state_save_pending = False
+        # Bytes last read from or written to the state file; saves that
+        # would produce identical content skip the disk entirely.
+        self._last_state_bytes: bytes | None = None
+        self._undo_stack_limit = MAX_HISTORY
+        self._redo_stack_limit = MAX_HISTORY
+        # Bounded deques drop the oldest entry in O(1) once the limit is hit.
+        self._undo_stack: deque[HistoryAction] = deque(maxlen=self._undo_stack_limit)
+        self._redo_stack: deque[HistoryAction] = deque(maxlen=self._redo_stack_limit)
         self._cached_monitor_bounds: tuple[int, int, int, int] | None = None
         self._cached_monitor_geometry: tuple[int, int, int, int] | None = None
+        self._monitor_list_cache: list[tuple[int, int, int, int]] | None = None
+        self._monitor_list_cache_time = 0.0
+        self._monitor_invalidate_after_id: str | None = None
+        self._cached_screen_geometry: (
+            tuple[tuple[int, int, int, int] | None, int, int] | None
+        ) = None
 
         self._load_state()
         self._reset_drag_state()
@@ -276,6 +668,7 @@ class YBSApp:
         self._configure_style()
         self._build_layout()
         self.root.bind("<Configure>", self._invalidate_monitor_cache, add="+")
+        self.root.bind("<Configure>", self._invalidate_calendar_geometry, add="+")
         self.root.bind_all("<Control-z>", self._undo_last_action)
         self.root.bind_all("<Command-z>", self._undo_last_action)
         self.root.bind_all("<Control-Shift-Z>", self._redo_last_action)
@@ -285,7 +678,10 @@ class YBSApp:
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._poll_queue()
 
+    # Date keys repeat across saves, loads and the notes/assignments maps, so
+    # the (de)serialized forms are memoized.
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _serialize_date_key(date_key: DateKey) -> str:
         try:
             year, month, day = (
@@ -298,6 +694,7 @@ class YBSApp:
         return f"{year:04d}-{month:02d}-{day:02d}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _deserialize_date_key(key: str) -> DateKey | None:
         if not isinstance(key, str):
             return None
@@ -309,8 +706,41 @@ class YBSApp:
         except (TypeError, ValueError):
             return None
 
+    @staticmethod
+    def _encode_state(state: dict[str, Any]) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        return json.dumps(state, ensure_ascii=False, indent=2).encode("utf-8")
+
+    @staticmethod
+    def _decode_state(data: bytes) -> object:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _assignment_pair(order_number: str, company: str) -> Tuple[str, str]:
+        """Return a shared, interned ``(order_number, company)`` tuple.
+
+        The same order or company tends to appear on many saved days, so
+        loading hash-conses the pairs instead of keeping a copy per entry.
+        """
+
+        return (sys.intern(order_number), sys.intern(company))
+
     @staticmethod
     def _normalize_assignment(values: Iterable[object]) -> Tuple[str, str]:
+        # Stored assignments are already (str, str) pairs, and drag, drop and
+        # removal paths normalise them one by one, so those pass straight
+        # through instead of being copied.
+        if (
+            type(values) is tuple
+            and len(values) == 2
+            and type(values[0]) is str
+            and type(values[1]) is str
+        ):
+            return values
         sequence = tuple(str(value) for value in values)
         first = sequence[0] if len(sequence) > 0 else ""
         second = sequence[1] if len(sequence) > 1 else ""
@@ -326,46 +756,187 @@ class YBSApp:
 
     @classmethod
     def _is_shift_pressed(cls, event: tk.Event | None) -> bool:
-        return cls._event_state_has_flag(event, 0x0001)
+        return cls._event_state_has_flag(event, SHIFT_MASK)
 
     @classmethod
     def _is_control_pressed(cls, event: tk.Event | None) -> bool:
-        control_masks: tuple[int, ...] = (0x0004,)
-        if sys.platform == "darwin":
-            control_masks += (0x0010,)
-        return any(cls._event_state_has_flag(event, mask) for mask in control_masks)
+        return cls._event_state_has_flag(event, CONTROL_MASK)
+
+    def _invalidate_monitor_cache(self, event: tk.Event | None = None) -> None:
+        """Clear cached monitor information shortly after the window changes."""
+
+        if event is None:
+            self._clear_monitor_cache()
+            return
 
-    def _invalidate_monitor_cache(self, *_: object) -> None:
-        """Clear cached monitor information."""
+        # Child widgets report <Configure> through the root binding as well,
+        # but only the main window moving or resizing affects the monitors.
+        if getattr(event, "widget", None) is not self.root:
+            return
+
+        # A window drag produces a burst of events; clear the caches once per
+        # burst rather than on every event so lookups in between stay cached.
+        if self._monitor_invalidate_after_id is not None:
+            return
+        try:
+            self._monitor_invalidate_after_id = self.root.after(
+                MONITOR_INVALIDATE_DELAY_MS, self._clear_monitor_cache
+            )
+        except tk.TclError:
+            self._clear_monitor_cache()
 
+    def _clear_monitor_cache(self) -> None:
+        self._monitor_invalidate_after_id = None
         self._cached_monitor_bounds = None
         self._cached_monitor_geometry = None
+        self._monitor_list_cache = None
+        self._cached_screen_geometry = None
+
+    def _query_root_winfo(self, *options: str) -> tuple[int, ...]:
+        """Return ``winfo <option>`` of the root for each option in one Tcl call."""
+
+        path = str(self.root)
+        script = "list " + " ".join(f"[winfo {option} {path}]" for option in options)
+        interpreter = self.root.tk
+        return tuple(
+            int(value) for value in interpreter.splitlist(interpreter.eval(script))
+        )
+
+    def _get_screen_geometry(
+        self,
+    ) -> tuple[tuple[int, int, int, int] | None, int, int]:
+        """Return the virtual root bounds and the screen size, cached."""
+
+        cached = self._cached_screen_geometry
+        if cached is not None:
+            return cached
+
+        vroot_bounds: tuple[int, int, int, int] | None = None
+        try:
+            (
+                vroot_x,
+                vroot_y,
+                vroot_width,
+                vroot_height,
+                screen_width,
+                screen_height,
+            ) = self._query_root_winfo(
+                "vrootx",
+                "vrooty",
+                "vrootwidth",
+                "vrootheight",
+                "screenwidth",
+                "screenheight",
+            )
+        except (tk.TclError, ValueError):
+            return (None, 0, 0)
+
+        if vroot_width > 0 and vroot_height > 0:
+            vroot_bounds = (
+                vroot_x,
+                vroot_y,
+                vroot_x + vroot_width,
+                vroot_y + vroot_height,
+            )
+
+        cached = (vroot_bounds, screen_width, screen_height)
+        self._cached_screen_geometry = cached
+        return cached
+
+    def _enumerate_monitors(self) -> list[tuple[int, int, int, int]]:
+        """Return ``(left, top, right, bottom)`` for each detected monitor."""
+
+        monitors = self._monitor_list_cache
+        if (
+            monitors is not None
+            and time.monotonic() - self._monitor_list_cache_time
+            < MONITOR_LIST_CACHE_SECONDS
+        ):
+            return monitors
+
+        monitors = []
+        get_monitors = _screeninfo_get_monitors()
+        if get_monitors is not None:
+            for monitor in get_monitors():
+                try:
+                    left = int(getattr(monitor, "x"))
+                    top = int(getattr(monitor, "y"))
+                    width = int(getattr(monitor, "width"))
+                    height = int(getattr(monitor, "height"))
+                except (AttributeError, TypeError, ValueError):
+                    continue
+                if width <= 0 or height <= 0:
+                    continue
+                monitors.append((left, top, left + width, top + height))
+
+        on_x11 = sys.platform.startswith(("linux", "freebsd")) and bool(
+            os.environ.get("DISPLAY")
+        )
+        if not monitors and on_x11:
+            monitors = _xlib_randr_monitors()
+
+        if not monitors and on_x11:
+            try:
+                result = subprocess.run(
+                    ["xrandr", "--current"],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=0.5,
+                )
+            except (OSError, subprocess.SubprocessError):
+                result = None
+            if result and result.returncode == 0 and result.stdout:
+                for match in XRANDR_MONITOR_PATTERN.finditer(result.stdout):
+                    try:
+                        width = int(match.group("w"))
+                        height = int(match.group("h"))
+                        left = int(match.group("x"))
+                        top = int(match.group("y"))
+                    except (TypeError, ValueError):
+                        continue
+                    if width <= 0 or height <= 0:
+                        continue
+                    monitors.append((left, top, left + width, top + height))
+
+        self._monitor_list_cache = monitors
+        self._monitor_list_cache_time = time.monotonic()
+        return monitors
 
     def _get_monitor_bounds(
         self, reference: tuple[int, int] | None = None
     ) -> tuple[int, int, int, int] | None:
         """Return the bounding rectangle for the monitor containing ``reference``."""
 
-        try:
-            self.root.update_idletasks()
-        except tk.TclError:
-            pass
-
         default_reference = reference is None
         geometry: tuple[int, int, int, int] | None = None
         if reference is None:
+            # Pending geometry work only matters for measuring the root window
+            # before it has been measured once; callers passing a reference
+            # (drag positioning) already know their coordinates.
+            if self._cached_monitor_geometry is None:
+                try:
+                    self.root.update_idletasks()
+                except tk.TclError:
+                    pass
             try:
-                root_x = int(self.root.winfo_rootx())
-                root_y = int(self.root.winfo_rooty())
-                root_width = int(self.root.winfo_width())
-                root_height = int(self.root.winfo_height())
-            except tk.TclError:
+                (
+                    root_x,
+                    root_y,
+                    root_width,
+                    root_height,
+                    requested_width,
+                    requested_height,
+                ) = self._query_root_winfo(
+                    "rootx", "rooty", "width", "height", "reqwidth", "reqheight"
+                )
+            except (tk.TclError, ValueError):
                 reference = (0, 0)
             else:
                 if root_width <= 1:
-                    root_width = int(self.root.winfo_reqwidth())
+                    root_width = requested_width
                 if root_height <= 1:
-                    root_height = int(self.root.winfo_reqheight())
+                    root_height = requested_height
                 geometry = (root_x, root_y, root_width, root_height)
                 reference = (
                     root_x + root_width // 2,
@@ -387,150 +958,30 @@ class YBSApp:
         bounds: tuple[int, int, int, int] | None = None
 
         if bounds is None and sys.platform.startswith("win"):
-            try:
-                import ctypes
-                from ctypes import wintypes
-            except Exception:
-                pass
-            else:
-                MonitorFromPoint = getattr(
-                    ctypes.windll.user32, "MonitorFromPoint", None
-                )
-                GetMonitorInfo = getattr(ctypes.windll.user32, "GetMonitorInfoW", None)
-                if MonitorFromPoint and GetMonitorInfo:
-                    MONITOR_DEFAULTTONEAREST = 2
-
-                    class POINT(ctypes.Structure):
-                        _fields_ = [
-                            ("x", wintypes.LONG),
-                            ("y", wintypes.LONG),
-                        ]
-
-                    class RECT(ctypes.Structure):
-                        _fields_ = [
-                            ("left", wintypes.LONG),
-                            ("top", wintypes.LONG),
-                            ("right", wintypes.LONG),
-                            ("bottom", wintypes.LONG),
-                        ]
-
-                    class MONITORINFO(ctypes.Structure):
-                        _fields_ = [
-                            ("cbSize", wintypes.DWORD),
-                            ("rcMonitor", RECT),
-                            ("rcWork", RECT),
-                            ("dwFlags", wintypes.DWORD),
-                        ]
-
-                    point = POINT(ref_x, ref_y)
-                    monitor = MonitorFromPoint(point, MONITOR_DEFAULTTONEAREST)
-                    if monitor:
-                        info = MONITORINFO()
-                        info.cbSize = ctypes.sizeof(info)
-                        if GetMonitorInfo(monitor, ctypes.byref(info)):
-                            rect = info.rcMonitor
-                            left, top, right, bottom = (
-                                int(rect.left),
-                                int(rect.top),
-                                int(rect.right),
-                                int(rect.bottom),
-                            )
-                            if left < right and top < bottom:
-                                bounds = (left, top, right, bottom)
+            monitor_rect = _win32_monitor_lookup()
+            if monitor_rect is not None:
+                bounds = monitor_rect(ref_x, ref_y)
 
         if bounds is None:
-            try:
-                from screeninfo import get_monitors  # type: ignore
-            except Exception:
-                pass
-            else:
-                monitors: list[tuple[int, int, int, int]] = []
-                for monitor in get_monitors():
-                    try:
-                        left = int(getattr(monitor, "x"))
-                        top = int(getattr(monitor, "y"))
-                        width = int(getattr(monitor, "width"))
-                        height = int(getattr(monitor, "height"))
-                    except (AttributeError, TypeError, ValueError):
-                        continue
-                    if width <= 0 or height <= 0:
-                        continue
-                    monitors.append((left, top, left + width, top + height))
-                for left, top, right, bottom in monitors:
-                    if left <= ref_x < right and top <= ref_y < bottom:
-                        bounds = (left, top, right, bottom)
-                        break
-                if bounds is None and monitors:
-                    bounds = monitors[0]
-
-        if (
-            bounds is None
-            and sys.platform.startswith(("linux", "freebsd"))
-            and os.environ.get("DISPLAY")
-        ):
-            try:
-                result = subprocess.run(
-                    ["xrandr", "--current"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=0.5,
-                )
-            except (OSError, subprocess.SubprocessError):
-                result = None
-            if result and result.returncode == 0 and result.stdout:
-                monitors: list[tuple[int, int, int, int]] = []
-                for line in result.stdout.splitlines():
-                    match = XRANDR_MONITOR_PATTERN.match(line)
-                    if not match:
-                        continue
-                    try:
-                        width = int(match.group("w"))
-                        height = int(match.group("h"))
-                        left = int(match.group("x"))
-                        top = int(match.group("y"))
-                    except (TypeError, ValueError):
-                        continue
-                    if width <= 0 or height <= 0:
-                        continue
-                    monitors.append((left, top, left + width, top + height))
-                for left, top, right, bottom in monitors:
-                    if left <= ref_x < right and top <= ref_y < bottom:
-                        bounds = (left, top, right, bottom)
-                        break
-                if bounds is None and monitors:
-                    bounds = monitors[0]
+            monitors = self._enumerate_monitors()
+            for left, top, right, bottom in monitors:
+                if left <= ref_x < right and top <= ref_y < bottom:
+                    bounds = (left, top, right, bottom)
+                    break
+            if bounds is None and monitors:
+                bounds = monitors[0]
 
         if bounds is None:
-            vroot_bounds: tuple[int, int, int, int] | None = None
-            try:
-                vroot_x = int(self.root.winfo_vrootx())
-                vroot_y = int(self.root.winfo_vrooty())
-                vroot_width = int(self.root.winfo_vrootwidth())
-                vroot_height = int(self.root.winfo_vrootheight())
-            except (tk.TclError, ValueError):
-                vroot_width = vroot_height = 0
-            else:
-                if vroot_width > 0 and vroot_height > 0:
-                    vroot_bounds = (
-                        vroot_x,
-                        vroot_y,
-                        vroot_x + vroot_width,
-                        vroot_y + vroot_height,
-                    )
-
-            try:
-                screen_width = int(self.root.winfo_screenwidth())
-                screen_height = int(self.root.winfo_screenheight())
-            except (tk.TclError, ValueError):
-                screen_width = screen_height = 0
+            vroot_bounds, screen_width, screen_height = self._get_screen_geometry()
 
             if screen_width > 0 and screen_height > 0:
-                try:
-                    root_left = int(self.root.winfo_rootx())
-                    root_top = int(self.root.winfo_rooty())
-                except tk.TclError:
-                    root_left = root_top = 0
+                if geometry is not None:
+                    root_left, root_top = geometry[0], geometry[1]
+                else:
+                    try:
+                        root_left, root_top = self._query_root_winfo("rootx", "rooty")
+                    except (tk.TclError, ValueError):
+                        root_left = root_top = 0
 
                 left = root_left
                 top = root_top
@@ -607,14 +1058,21 @@ class YBSApp:
     def _load_state(self) -> None:
         notes: Dict[DateKey, str] = {}
         assignments: Dict[DateKey, List[Tuple[str, str]]] = {}
+        # The serialized mirrors are filled alongside so the first save after
+        # loading does not have to re-serialize every day.
+        serialized_notes: Dict[str, str] = {}
+        serialized_assignments: Dict[str, List[Tuple[str, str]]] = {}
 
         data: object | None = None
         try:
-            with self._state_path.open("r", encoding="utf-8") as state_file:
-                data = json.load(state_file)
+            raw_state = self._state_path.read_bytes()
+            data = self._decode_state(raw_state)
+            self._last_state_bytes = raw_state
         except FileNotFoundError:
             data = None
-        except (OSError, json.JSONDecodeError):
+        except (OSError, ValueError):
+            # ValueError covers JSONDecodeError (orjson's included) as well as
+            # a state file that is not valid UTF-8.
             data = None
 
         if isinstance(data, dict):
@@ -625,6 +1083,7 @@ class YBSApp:
                     if date_key is None or not isinstance(value, str):
                         continue
                     notes[date_key] = value
+                    serialized_notes[self._serialize_date_key(date_key)] = value
 
             raw_assignments = data.get("assignments", {})
             if isinstance(raw_assignments, dict):
@@ -635,169 +1094,201 @@ class YBSApp:
 
                     normalized_assignments: List[Tuple[str, str]] = []
                     for entry in value:
-                        if isinstance(entry, (list, tuple)):
-                            first = str(entry[0]) if len(entry) > 0 else ""
-                            second = str(entry[1]) if len(entry) > 1 else ""
-                            normalized_assignments.append((first, second))
-                        elif isinstance(entry, str):
-                            normalized_assignments.append((entry, ""))
+                        if isinstance(entry, str):
+                            normalized_assignments.append(
+                                self._assignment_pair(entry, "")
+                            )
+                            continue
+                        # Nearly every entry is an [order, company] pair, so
+                        # index first and only sort out odd shapes on failure.
+                        try:
+                            first, second = entry[0], entry[1]
+                        except (TypeError, IndexError, KeyError):
+                            if not isinstance(entry, (list, tuple)):
+                                continue
+                            first, second = (entry[0] if entry else ""), ""
+                        normalized_assignments.append(
+                            self._assignment_pair(str(first), str(second))
+                        )
 
                     if normalized_assignments:
                         assignments[date_key] = normalized_assignments
+                        serialized_assignments[
+                            self._serialize_date_key(date_key)
+                        ] = list(normalized_assignments)
 
         self._calendar_notes = notes
         self._calendar_assignments = assignments
+        self._serialized_notes = serialized_notes
+        self._serialized_assignments = serialized_assignments
+        self._dirty_date_keys.clear()
+        self._state_needs_full_sync = False
+
+    def _snapshot_state(self) -> dict[str, Any]:
+        """Refresh the serialized state and return a copy safe to hand off."""
+
+        notes = self._serialized_notes
+        assignments = self._serialized_assignments
+        if self._state_needs_full_sync:
+            notes.clear()
+            notes.update(
+                (self._serialize_date_key(key), value)
+                for key, value in self._calendar_notes.items()
+            )
+            # Both JSON encoders write the (order, company) tuples as arrays,
+            # so each day only needs a shallow copy, not a list per entry.
+            assignments.clear()
+            assignments.update(
+                (self._serialize_date_key(key), list(value))
+                for key, value in self._calendar_assignments.items()
+            )
+            self._state_needs_full_sync = False
+        else:
+            for key in self._dirty_date_keys:
+                serialized_key = self._serialize_date_key(key)
 
-    def _save_state(self) -> None:
-        self._state_save_after_id = None
-
-        notes = {
-            self._serialize_date_key(key): value
-            for key, value in self._calendar_notes.items()
-        }
-        assignments = {
-            self._serialize_date_key(key): [list(item) for item in value]
-            for key, value in self._calendar_assignments.items()
-        }
-
-        state = {"notes": notes, "assignments": assignments}
+                note = self._calendar_notes.get(key)
+                if note is None:
+                    notes.pop(serialized_key, None)
+                else:
+                    notes[serialized_key] = note
 
+                day_assignments = self._calendar_assignments.get(key)
+                if day_assignments is None:
+                    assignments.pop(serialized_key, None)
+                else:
+                    assignments[serialized_key] = list(day_assignments)
+        self._dirty_date_keys.clear()
+
+        # Entries are replaced rather than mutated, so shallow copies are
+        # enough to keep the worker isolated from later edits.
+        return {"notes": dict(notes), "assignments": dict(assignments)}
+
+    def _write_state(self, state: dict[str, Any]) -> bool:
+        encoded_state = self._encode_state(state)
+        if encoded_state == self._last_state_bytes:
+            return True
+        # Write a sibling file and swap it in so a crash mid-write never
+        # leaves a truncated state file behind. The directory is created in
+        # __init__; fsync is skipped deliberately, losing the last second of
+        # edits on power loss is acceptable here.
+        temp_path = self._state_path.with_suffix(".json.tmp")
         try:
-            self._state_path.parent.mkdir(parents=True, exist_ok=True)
-            with self._state_path.open("w", encoding="utf-8") as state_file:
-                json.dump(state, state_file, ensure_ascii=False, indent=2)
+            temp_path.write_bytes(encoded_state)
+            os.replace(temp_path, self._state_path)
         except OSError:
-            pass
-
-    def _schedule_state_save(self) -> None:
-        if self._state_save_after_id is not None:
             try:
-                self.root.after_cancel(self._state_save_after_id)
-            except tk.TclError:
+                temp_path.unlink()
+            except OSError:
                 pass
+            return False
+        self._last_state_bytes = encoded_state
+        return True
 
-        try:
-            self._state_save_after_id = self.root.after(1000, self._save_state)
-        except tk.TclError:
-            self._state_save_after_id = None
+    def _save_state(self) -> None:
+        self._state_save_after_id = None
 
-    def _normalize_date_key(self, date_key: object) -> DateKey | None:
-        if isinstance(date_key, (tuple, list)) and len(date_key) == 3:
-            try:
-                return (int(date_key[0]), int(date_key[1]), int(date_key[2]))
-            except (TypeError, ValueError):
-                return None
-        return None
+        if self._state_save_thread is not None:
+            self._state_save_pending = True
+            return
 
-    def _capture_assignments_state(self, date_key: DateKey) -> dict[str, Any]:
-        had_key = date_key in self._calendar_assignments
-        if not had_key:
-            return {"had_key": False, "previous": None}
-
-        assignments = self._calendar_assignments.get(date_key, [])
-        previous: list[Tuple[str, str]] = []
-        for entry in assignments:
-            if isinstance(entry, (list, tuple)):
-                first = str(entry[0]) if len(entry) > 0 else ""
-                second = str(entry[1]) if len(entry) > 1 else ""
-                previous.append((first, second))
-        return {"had_key": True, "previous": previous}
-
-    def _capture_notes_state(self, date_key: DateKey) -> dict[str, Any]:
-        had_key = date_key in self._calendar_notes
-        previous = self._calendar_notes.get(date_key) if had_key else None
-        if isinstance(previous, str):
-            return {"had_key": had_key, "previous": previous}
-        return {"had_key": had_key, "previous": None}
-
-    def _normalize_history_action(
-        self, action: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        if not isinstance(action, dict):
-            return None
+        thread = threading.Thread(
+            target=self._save_state_worker,
+            args=(self._snapshot_state(),),
+            daemon=True,
+        )
+        self._state_save_thread = thread
+        thread.start()
 
-        kind = action.get("kind")
+    def _save_state_worker(self, state: dict[str, Any]) -> None:
+        success = False
+        try:
+            success = self._write_state(state)
+        finally:
+            self._queue.put(("state_saved", success))
 
-        if kind == "assignments":
-            raw_dates = action.get("dates")
-            if not isinstance(raw_dates, dict) or not raw_dates:
-                return None
+    def _on_state_saved(self) -> None:
+        self._state_save_thread = None
+        if self._state_save_pending:
+            self._state_save_pending = False
+            self._save_state()
 
-            normalized_dates: dict[DateKey, dict[str, Any]] = {}
-            for raw_key, info in raw_dates.items():
-                normalized_key = self._normalize_date_key(raw_key)
-                if normalized_key is None:
-                    continue
+    def _schedule_state_save(self, *date_keys: DateKey) -> None:
+        """Save the calendar state shortly, after changes to ``date_keys``.
 
-                info_dict = info if isinstance(info, dict) else {}
-                had_key = bool(info_dict.get("had_key"))
-                previous_raw = info_dict.get("previous")
-                previous_list: list[Tuple[str, str]] | None = None
-                if isinstance(previous_raw, list):
-                    previous_list = []
-                    for entry in previous_raw:
-                        if isinstance(entry, (list, tuple)):
-                            first = str(entry[0]) if len(entry) > 0 else ""
-                            second = str(entry[1]) if len(entry) > 1 else ""
-                            previous_list.append((first, second))
-
-                normalized_dates[normalized_key] = {
-                    "had_key": had_key,
-                    "previous": previous_list,
-                }
+        Without any ``date_keys`` the whole state is serialized again.
+        """
 
-            if not normalized_dates:
-                return None
+        if date_keys:
+            self._dirty_date_keys.update(date_keys)
+        else:
+            self._state_needs_full_sync = True
 
-            return {"kind": "assignments", "dates": normalized_dates}
+        # A save already pending picks up these keys as well; leaving it in
+        # place also means a stream of edits cannot postpone saving forever.
+        if self._state_save_after_id is not None:
+            return
 
-        if kind == "notes":
-            normalized_key = self._normalize_date_key(action.get("date_key"))
-            if normalized_key is None:
-                return None
+        try:
+            self._state_save_after_id = self.root.after(
+                STATE_SAVE_DELAY_MS, self._save_state
+            )
+        except tk.TclError:
+            self._state_save_after_id = None
 
-            had_key = bool(action.get("had_key"))
-            previous_raw = action.get("previous")
-            if isinstance(previous_raw, str):
-                previous_value: str | None = previous_raw
-            elif previous_raw is None:
-                previous_value = None
-            else:
-                previous_value = str(previous_raw)
+    def _apply_assignments_diff(
+        self,
+        date_key: DateKey,
+        remove: List[Tuple[int, Tuple[str, str]]],
+        insert: List[Tuple[int, Tuple[str, str]]],
+    ) -> None:
+        """Remove and then insert the given positioned entries for one day."""
 
-            return {
-                "kind": "notes",
-                "date_key": normalized_key,
-                "had_key": had_key,
-                "previous": previous_value,
-            }
+        # The stored list is edited in place, so the dict itself is only
+        # touched when the day gains its first entry or loses its last.
+        assignments = self._calendar_assignments.get(date_key)
+        is_new = assignments is None
+        if is_new:
+            assignments = []
+        for index, entry in reversed(remove):
+            if 0 <= index < len(assignments) and assignments[index] == entry:
+                assignments.pop(index)
+            else:
+                try:
+                    assignments.remove(entry)
+                except ValueError:
+                    pass
+        for index, entry in insert:
+            assignments.insert(index, entry)
 
-        return None
+        if not assignments:
+            self._calendar_assignments.pop(date_key, None)
+        elif is_new:
+            self._calendar_assignments[date_key] = assignments
 
-    def _push_undo_action(
-        self, action: dict[str, Any], *, clear_redo: bool = True
-    ) -> None:
-        normalized_action = self._normalize_history_action(action)
-        if normalized_action is None:
-            return
+    def _capture_notes_state(self, date_key: DateKey) -> NotesAction:
+        previous = self._calendar_notes.get(date_key)
+        return NotesAction(
+            date_key=date_key,
+            had_key=previous is not None,
+            previous=previous if previous is not None else "",
+        )
 
-        self._undo_stack.append(normalized_action)
-        limit = getattr(self, "_undo_stack_limit", 0)
-        if isinstance(limit, int) and limit > 0 and len(self._undo_stack) > limit:
-            del self._undo_stack[: len(self._undo_stack) - limit]
+    def _safe_focus_get(self) -> tk.Misc | None:
+        try:
+            return self.root.focus_get()
+        except (tk.TclError, KeyError):
+            return None
 
+    def _push_undo_action(
+        self, action: HistoryAction, *, clear_redo: bool = True
+    ) -> None:
+        self._undo_stack.append(action)
         if clear_redo:
             self._redo_stack.clear()
 
-    def _push_redo_action(self, action: dict[str, Any]) -> None:
-        normalized_action = self._normalize_history_action(action)
-        if normalized_action is None:
-            return
-
-        self._redo_stack.append(normalized_action)
-        limit = getattr(self, "_redo_stack_limit", 0)
-        if isinstance(limit, int) and limit > 0 and len(self._redo_stack) > limit:
-            del self._redo_stack[: len(self._redo_stack) - limit]
+    def _push_redo_action(self, action: HistoryAction) -> None:
+        self._redo_stack.append(action)
 
     def _undo_last_action(self, event: tk.Event | None = None) -> str | None:
         widget = getattr(event, "widget", None)
@@ -819,114 +1310,44 @@ class YBSApp:
             return "break" if event is not None else None
 
         action = self._undo_stack.pop()
-        kind = action.get("kind")
         restored = False
         status_message = ""
+        changed_keys: list[DateKey] = []
 
-        if kind == "assignments":
-            entries = action.get("dates")
-            if isinstance(entries, dict):
+        if isinstance(action, AssignmentsAction):
+            if action.dates:
                 restored_labels: list[str] = []
-                redo_dates: dict[DateKey, dict[str, Any]] = {}
-                for raw_key, info in entries.items():
-                    normalized_key = self._normalize_date_key(raw_key)
-                    if normalized_key is None:
-                        continue
-
-                    redo_dates[normalized_key] = self._capture_assignments_state(
-                        normalized_key
-                    )
-
-                    info_dict = info if isinstance(info, dict) else {}
-                    previous_raw = info_dict.get("previous")
-                    restored_assignments: list[Tuple[str, str]] = []
-                    if isinstance(previous_raw, list):
-                        for entry in previous_raw:
-                            if isinstance(entry, (list, tuple)):
-                                first = str(entry[0]) if len(entry) > 0 else ""
-                                second = str(entry[1]) if len(entry) > 1 else ""
-                                restored_assignments.append((first, second))
-
-                    if restored_assignments:
-                        self._calendar_assignments[normalized_key] = restored_assignments
-                    else:
-                        self._calendar_assignments.pop(normalized_key, None)
+                for date_key, diff in action.dates.items():
+                    self._apply_assignments_diff(date_key, diff.added, diff.removed)
 
-                    self._update_day_cell_display(normalized_key)
-                    restored_labels.append(self._format_date_label(normalized_key))
+                    self._queue_day_cell_display(date_key)
+                    restored_labels.append(self._format_date_label(date_key))
+                    changed_keys.append(date_key)
                     restored = True
 
-                if redo_dates:
-                    self._push_redo_action({"kind": "assignments", "dates": redo_dates})
+                # Diffs replay in either direction, so redo reuses the entry.
+                self._push_redo_action(action)
 
                 if restored_labels:
-                    if len(restored_labels) == 1:
-                        status_message = (
-                            f"Undo: restored assignments for {restored_labels[0]}."
-                        )
-                    else:
-                        status_message = (
-                            "Undo: restored assignments for "
-                            + ", ".join(restored_labels)
-                            + "."
-                        )
-        elif kind == "notes":
-            normalized_key = self._normalize_date_key(action.get("date_key"))
-            if normalized_key is not None:
-                redo_snapshot = self._capture_notes_state(normalized_key)
-                self._push_redo_action(
-                    {
-                        "kind": "notes",
-                        "date_key": normalized_key,
-                        "had_key": bool(redo_snapshot.get("had_key")),
-                        "previous": redo_snapshot.get("previous"),
-                    }
-                )
-
-                previous_raw = action.get("previous")
-                had_key = bool(action.get("had_key"))
-
-                if isinstance(previous_raw, str):
-                    restored_text = previous_raw
-                    self._calendar_notes[normalized_key] = restored_text
-                elif previous_raw is None and not had_key:
-                    restored_text = ""
-                    self._calendar_notes.pop(normalized_key, None)
-                else:
-                    restored_text = str(previous_raw) if previous_raw is not None else ""
-                    if restored_text:
-                        self._calendar_notes[normalized_key] = restored_text
-                    else:
-                        self._calendar_notes.pop(normalized_key, None)
-
-                day_cell = self._day_cells.get(normalized_key)
-                if day_cell:
-                    notes_widget = day_cell.notes_text
-                    try:
-                        focused_widget = self.root.focus_get()
-                    except tk.TclError:
-                        focused_widget = None
-
-                    has_focus = focused_widget is notes_widget
-                    if widget is notes_widget:
-                        has_focus = True
-
-                    notes_widget.delete("1.0", tk.END)
-                    if restored_text:
-                        notes_widget.insert("1.0", restored_text)
-                    if has_focus:
-                        try:
-                            notes_widget.focus_set()
-                        except tk.TclError:
-                            pass
-
-                status_message = (
-                    f"Undo: restored notes for {self._format_date_label(normalized_key)}."
-                )
-                restored = True
+                    status_message = (
+                        "Undo: restored assignments for "
+                        f"{', '.join(restored_labels)}."
+                    )
+        elif isinstance(action, NotesAction):
+            date_key = action.date_key
+            current = self._capture_notes_state(date_key)
+            # Restoring what is already there needs no way back.
+            if current != action:
+                self._push_redo_action(current)
+
+            status_message = self._apply_notes_snapshot(
+                action, widget, kind_label="Undo"
+            )
+            changed_keys.append(date_key)
+            restored = True
 
         if restored:
-            self._schedule_state_save()
+            self._schedule_state_save(*changed_keys)
             if status_message:
                 self._set_status(SUCCESS_COLOR, status_message)
         else:
@@ -954,125 +1375,104 @@ class YBSApp:
             return "break" if event is not None else None
 
         action = self._redo_stack.pop()
-        kind = action.get("kind")
         applied = False
         status_message = ""
+        changed_keys: list[DateKey] = []
 
-        if kind == "assignments":
-            entries = action.get("dates")
-            if isinstance(entries, dict):
-                undo_entries: dict[DateKey, dict[str, Any]] = {}
+        if isinstance(action, AssignmentsAction):
+            if action.dates:
                 restored_labels: list[str] = []
-                for raw_key, info in entries.items():
-                    normalized_key = self._normalize_date_key(raw_key)
-                    if normalized_key is None:
-                        continue
-
-                    undo_entries[normalized_key] = self._capture_assignments_state(
-                        normalized_key
-                    )
-
-                    info_dict = info if isinstance(info, dict) else {}
-                    previous_raw = info_dict.get("previous")
-                    restored_assignments: list[Tuple[str, str]] = []
-                    if isinstance(previous_raw, list):
-                        for entry in previous_raw:
-                            if isinstance(entry, (list, tuple)):
-                                first = str(entry[0]) if len(entry) > 0 else ""
-                                second = str(entry[1]) if len(entry) > 1 else ""
-                                restored_assignments.append((first, second))
-
-                    if restored_assignments:
-                        self._calendar_assignments[normalized_key] = restored_assignments
-                    else:
-                        self._calendar_assignments.pop(normalized_key, None)
+                for date_key, diff in action.dates.items():
+                    self._apply_assignments_diff(date_key, diff.removed, diff.added)
 
-                    self._update_day_cell_display(normalized_key)
-                    restored_labels.append(self._format_date_label(normalized_key))
+                    self._queue_day_cell_display(date_key)
+                    restored_labels.append(self._format_date_label(date_key))
+                    changed_keys.append(date_key)
                     applied = True
 
-                if undo_entries:
-                    self._push_undo_action(
-                        {"kind": "assignments", "dates": undo_entries},
-                        clear_redo=False,
-                    )
+                self._push_undo_action(action, clear_redo=False)
 
                 if restored_labels:
-                    if len(restored_labels) == 1:
-                        status_message = (
-                            f"Redo: restored assignments for {restored_labels[0]}."
-                        )
-                    else:
-                        status_message = (
-                            "Redo: restored assignments for "
-                            + ", ".join(restored_labels)
-                            + "."
-                        )
+                    status_message = (
+                        "Redo: restored assignments for "
+                        f"{', '.join(restored_labels)}."
+                    )
 
-        elif kind == "notes":
-            normalized_key = self._normalize_date_key(action.get("date_key"))
-            if normalized_key is not None:
-                undo_snapshot = self._capture_notes_state(normalized_key)
-                self._push_undo_action(
-                    {
-                        "kind": "notes",
-                        "date_key": normalized_key,
-                        "had_key": bool(undo_snapshot.get("had_key")),
-                        "previous": undo_snapshot.get("previous"),
-                    },
-                    clear_redo=False,
-                )
+        elif isinstance(action, NotesAction):
+            date_key = action.date_key
+            current = self._capture_notes_state(date_key)
+            if current != action:
+                self._push_undo_action(current, clear_redo=False)
 
-                previous_raw = action.get("previous")
-                had_key = bool(action.get("had_key"))
+            status_message = self._apply_notes_snapshot(
+                action, widget, kind_label="Redo"
+            )
+            changed_keys.append(date_key)
+            applied = True
 
-                if isinstance(previous_raw, str):
-                    restored_text = previous_raw
-                    self._calendar_notes[normalized_key] = restored_text
-                elif previous_raw is None and not had_key:
-                    restored_text = ""
-                    self._calendar_notes.pop(normalized_key, None)
-                else:
-                    restored_text = str(previous_raw) if previous_raw is not None else ""
-                    if restored_text:
-                        self._calendar_notes[normalized_key] = restored_text
-                    else:
-                        self._calendar_notes.pop(normalized_key, None)
+        if applied:
+            self._schedule_state_save(*changed_keys)
+            if status_message:
+                self._set_status(SUCCESS_COLOR, status_message)
+        else:
+            self._set_status(FAIL_COLOR, "Nothing to redo.")
 
-                day_cell = self._day_cells.get(normalized_key)
-                if day_cell:
-                    notes_widget = day_cell.notes_text
-                    try:
-                        focused_widget = self.root.focus_get()
-                    except tk.TclError:
-                        focused_widget = None
+        return "break" if event is not None else None
+
+    def _apply_notes_snapshot(
+        self, action: NotesAction, widget: object | None, *, kind_label: str
+    ) -> str:
+        """Restore the notes recorded in ``action`` and return a status message."""
+
+        date_key = action.date_key
+        restored_text = action.previous
+        if action.had_key:
+            self._calendar_notes[date_key] = restored_text
+        else:
+            self._calendar_notes.pop(date_key, None)
 
-                    has_focus = focused_widget is notes_widget
-                    if widget is notes_widget:
-                        has_focus = True
+        day_cell = self._day_cells.get(date_key)
+        if day_cell:
+            notes_widget = day_cell.notes_text
+            # Only ask Tk for the focus when the event did not already
+            # come from the notes widget itself.
+            has_focus = (
+                widget is notes_widget
+                or self._safe_focus_get() is notes_widget
+            )
 
+            # Redoing right after an undo often lands on what the widget
+            # already shows; rewriting it would only churn its undo stack.
+            if notes_widget.get("1.0", "end-1c") != restored_text:
+                # Group the replacement into a single step of the widget's
+                # own undo history instead of separate delete/insert steps.
+                notes_widget.configure(autoseparators=False)
+                try:
+                    notes_widget.edit_separator()
                     notes_widget.delete("1.0", tk.END)
                     if restored_text:
                         notes_widget.insert("1.0", restored_text)
-                    if has_focus:
-                        try:
-                            notes_widget.focus_set()
-                        except tk.TclError:
-                            pass
+                    notes_widget.edit_separator()
+                finally:
+                    notes_widget.configure(autoseparators=True)
+                notes_widget.edit_modified(False)
+            self._dirty_note_keys.discard(date_key)
+            if has_focus:
+                try:
+                    notes_widget.focus_set()
+                except tk.TclError:
+                    pass
 
-                status_message = (
-                    f"Redo: restored notes for {self._format_date_label(normalized_key)}."
-                )
-                applied = True
+        date_label = self._format_date_label(date_key)
+        return f"{kind_label}: restored notes for {date_label}."
 
-        if applied:
-            self._schedule_state_save()
-            if status_message:
-                self._set_status(SUCCESS_COLOR, status_message)
-        else:
-            self._set_status(FAIL_COLOR, "Nothing to redo.")
+    def _on_notes_text_undo(self, event: tk.Event) -> str:
+        self._invoke_text_widget_undo(event)
+        return "break"
 
-        return "break" if event is not None else None
+    def _on_notes_text_redo(self, event: tk.Event) -> str:
+        self._invoke_text_widget_redo(event)
+        return "break"
 
     def _invoke_text_widget_undo(self, event: tk.Event) -> None:
         widget = getattr(event, "widget", None)
@@ -1098,7 +1498,14 @@ class YBSApp:
                 pass
             self._state_save_after_id = None
 
-        self._save_state()
+        # Let an in-flight background write finish before the final save so
+        # the two cannot interleave.
+        save_thread = self._state_save_thread
+        if save_thread is not None:
+            save_thread.join()
+            self._state_save_thread = None
+        self._state_save_pending = False
+        self._write_state(self._snapshot_state())
 
         try:
             self.root.destroy()
@@ -1381,6 +1788,7 @@ class YBSApp:
         for column_index in range(7):
             self.calendar_grid.columnconfigure(column_index, weight=1, uniform="calendar")
         self.calendar_grid.rowconfigure(0, weight=0)
+        self._build_calendar_grid()
 
         calendar_frame.columnconfigure(0, weight=1)
         calendar_frame.rowconfigure(1, weight=1)
@@ -1467,44 +1875,165 @@ class YBSApp:
 
         self._set_status(SUCCESS_COLOR, status_message)
 
+    def _build_calendar_grid(self) -> None:
+        """Create the weekday headers and the fixed pool of day cell widgets.
+
+        The cells are created once and repopulated by ``_render_calendar``
+        whenever the visible month changes.
+        """
+
+        # The notes widgets keep their own undo history; these keys are bound
+        # once on a shared bindtag that runs ahead of the Text class bindings.
+        for sequence in ("<Control-z>", "<Command-z>"):
+            self.root.bind_class(NOTES_UNDO_BINDTAG, sequence, self._on_notes_text_undo)
+        for sequence in (
+            "<Control-Shift-Z>",
+            "<Command-Shift-Z>",
+            "<Control-y>",
+            "<Command-y>",
+            "<Control-Y>",
+            "<Command-Y>",
+        ):
+            self.root.bind_class(NOTES_UNDO_BINDTAG, sequence, self._on_notes_text_redo)
+
+        for column_index in range(7):
+            header_label = ttk.Label(
+                self.calendar_grid,
+                text=DAY_ABBREVIATIONS[column_index],
+                style="Dark.TLabel",
+                anchor="center",
+            )
+            header_label.grid(row=0, column=column_index, sticky="nsew", padx=2, pady=(0, 6))
+
+        for cell_index in range(CALENDAR_CELL_COUNT):
+            row_index, column_index = divmod(cell_index, 7)
+            cell_frame = tk.Frame(
+                self.calendar_grid,
+                bg=DAY_CELL_BACKGROUND,
+                highlightbackground=ACCENT_COLOR,
+                highlightcolor=ACCENT_COLOR,
+                highlightthickness=1,
+                bd=0,
+            )
+            cell_frame.grid(
+                row=row_index + 1, column=column_index, sticky="nsew", padx=2, pady=2
+            )
+            cell_frame.grid_propagate(False)
+            cell_frame.configure(width=110, height=110)
+            cell_frame.columnconfigure(0, weight=1)
+            cell_frame.rowconfigure(1, weight=1)
+            cell_frame.rowconfigure(2, weight=1)
+
+            header_label = tk.Label(
+                cell_frame,
+                anchor="nw",
+                bg=DAY_CELL_BACKGROUND,
+                fg=TEXT_COLOR,
+                font=("TkDefaultFont", 10, "bold"),
+                padx=4,
+                pady=2,
+            )
+            header_label.grid(row=0, column=0, sticky="ew")
+            try:
+                header_label.configure(takefocus=True)
+            except tk.TclError:
+                pass
+
+            notes_text = tk.Text(
+                cell_frame,
+                height=3,
+                wrap=tk.WORD,
+                bg=NOTES_TEXT_BACKGROUND,
+                fg=TEXT_COLOR,
+                insertbackground=TEXT_COLOR,
+                relief="flat",
+                bd=0,
+                undo=True,
+                autoseparators=True,
+                maxundo=-1,
+            )
+            notes_text.grid(row=1, column=0, sticky="nsew", padx=4, pady=(2, 2))
+            notes_text.bindtags((NOTES_UNDO_BINDTAG,) + notes_text.bindtags())
+
+            orders_list = tk.Listbox(
+                cell_frame,
+                height=3,
+                activestyle="none",
+                exportselection=False,
+                selectmode=tk.EXTENDED,
+            )
+            orders_list.configure(
+                bg=ORDERS_LIST_BACKGROUND,
+                fg=TEXT_COLOR,
+                highlightbackground=ACCENT_COLOR,
+                highlightcolor=ACCENT_COLOR,
+                selectbackground="#1e90ff",
+                selectforeground=TEXT_COLOR,
+                relief="flat",
+                bd=0,
+            )
+            orders_list.grid(row=2, column=0, sticky="nsew", padx=4, pady=(0, 4))
+
+            for widget, role in (
+                (cell_frame, "frame"),
+                (header_label, "header"),
+                (notes_text, "notes"),
+                (orders_list, "orders"),
+            ):
+                for sequence, callback in self._day_cell_bindings[role]:
+                    widget.bind(sequence, callback)
+
+            self._day_cell_widgets.append(
+                (cell_frame, header_label, notes_text, orders_list)
+            )
+
     def _render_calendar(self) -> None:
         year = self._current_year
         month = self._current_month
         today = dt.date.today()
         today_key = (today.year, today.month, today.day)
-        first_of_month = dt.date(year, month, 1)
-        self.month_label_var.set(first_of_month.strftime("%B %Y"))
+        self.month_label_var.set(_month_year_label(year, month))
 
         self._remove_calendar_hover()
         self._day_cell_pointer_hover = None
         previous_active = self._active_day_header
 
-        for date_key, day_cell in list(self._day_cells.items()):
+        # Only notes edited since they were last saved need reading back.
+        # <<Modified>> is delivered through the event queue, so the focused
+        # widget is included in case its last keystroke is still pending.
+        dirty_note_keys = self._dirty_note_keys
+        self._dirty_note_keys = set()
+        focused_key = self._widget_date_keys.get(self._safe_focus_get())
+        if focused_key is not None:
+            dirty_note_keys.add(focused_key)
+        for date_key in dirty_note_keys:
             self._save_day_notes(date_key)
-            day_cell.frame.destroy()
 
+        # The widgets are about to show other days, so nothing may resolve
+        # to the dates they showed until they are reassigned below.
         self._day_cells.clear()
-
-        for child in self.calendar_grid.winfo_children():
-            child.destroy()
-
-        month_structure = calendar.Calendar().monthdatescalendar(year, month)
-
-        for column_index in range(7):
-            header_label = ttk.Label(
-                self.calendar_grid,
-                text=calendar.day_abbr[column_index],
-                style="Dark.TLabel",
-                anchor="center",
-            )
-            header_label.grid(row=0, column=column_index, sticky="nsew", padx=2, pady=(0, 6))
+        self._invalidate_calendar_geometry()
+        self._widget_date_keys.clear()
+        self._active_day_header = None
+
+        month_structure = _month_weeks(year, month)
+        cell_widgets = self._day_cell_widgets
+        day_cells = self._day_cells
+        widget_date_keys = self._widget_date_keys
+        calendar_notes = self._calendar_notes
+        tk_end = tk.END
+        cell_index = 0
 
         for row_index, week in enumerate(month_structure, start=1):
             self.calendar_grid.rowconfigure(row_index, weight=1, uniform="calendar_rows")
-            for column_index, day_date in enumerate(week):
+            for day_date in week:
+                cell_frame, header_label, notes_text, orders_list = (
+                    cell_widgets[cell_index]
+                )
+                cell_index += 1
+
                 is_current_month = day_date.month == month
                 date_key = (day_date.year, day_date.month, day_date.day)
-                day_number = day_date.day
                 is_today = date_key == today_key
                 border_color = TODAY_BORDER_COLOR if is_today else ACCENT_COLOR
                 border_thickness = 2 if is_today else 1
@@ -1526,135 +2055,10 @@ class YBSApp:
                     else ADJACENT_MONTH_ORDERS_BACKGROUND
                 )
                 orders_fg = TEXT_COLOR if is_current_month else ADJACENT_MONTH_TEXT_COLOR
-                cell_frame = tk.Frame(
-                    self.calendar_grid,
-                    bg=cell_background,
-                    highlightbackground=border_color,
-                    highlightcolor=border_color,
-                    highlightthickness=border_thickness,
-                    bd=0,
-                )
-                cell_frame.grid(row=row_index, column=column_index, sticky="nsew", padx=2, pady=2)
-                cell_frame.grid_propagate(False)
-                cell_frame.configure(width=110, height=110)
-                cell_frame.columnconfigure(0, weight=1)
-                cell_frame.rowconfigure(1, weight=1)
-                cell_frame.rowconfigure(2, weight=1)
-
-                header_label = tk.Label(
-                    cell_frame,
-                    text=str(day_number),
-                    anchor="nw",
-                    bg=cell_background,
-                    fg=header_fg,
-                    font=("TkDefaultFont", 10, "bold"),
-                    padx=4,
-                    pady=2,
-                )
-                header_label.grid(row=0, column=0, sticky="ew")
-                try:
-                    header_label.configure(takefocus=True)
-                except tk.TclError:
-                    pass
-
-                header_label.bind(
-                    "<Button-1>",
-                    lambda event, key=date_key: self._on_day_header_click(event, key),
-                )
-                header_label.bind(
-                    "<FocusIn>",
-                    lambda event, key=date_key: self._on_day_header_focus(key),
-                )
-                header_label.bind(
-                    "<Delete>",
-                    lambda event, key=date_key: self._on_day_clear_request(event, key),
-                )
-                header_label.bind(
-                    "<Destroy>",
-                    lambda event, key=date_key: self._on_day_header_destroy(event, key),
-                )
-                cell_frame.bind(
-                    "<Enter>",
-                    lambda event, key=date_key: self._on_day_cell_pointer_enter(event, key),
-                )
-                cell_frame.bind(
-                    "<Leave>",
-                    lambda event, key=date_key: self._on_day_cell_pointer_leave(event, key),
-                )
-                header_label.bind(
-                    "<Enter>",
-                    lambda event, key=date_key: self._on_day_cell_pointer_enter(event, key),
-                )
-                header_label.bind(
-                    "<Leave>",
-                    lambda event, key=date_key: self._on_day_cell_pointer_leave(event, key),
-                )
-
-                notes_text = tk.Text(
-                    cell_frame,
-                    height=3,
-                    wrap=tk.WORD,
-                    bg=notes_bg,
-                    fg=notes_fg,
-                    insertbackground=notes_fg,
-                    relief="flat",
-                    bd=0,
-                    undo=True,
-                    autoseparators=True,
-                    maxundo=-1,
-                )
-                notes_text.grid(row=1, column=0, sticky="nsew", padx=4, pady=(2, 2))
-                notes_text.bind(
-                    "<Control-z>",
-                    lambda event: (self._invoke_text_widget_undo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Command-z>",
-                    lambda event: (self._invoke_text_widget_undo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Control-Shift-Z>",
-                    lambda event: (self._invoke_text_widget_redo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Command-Shift-Z>",
-                    lambda event: (self._invoke_text_widget_redo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Control-y>",
-                    lambda event: (self._invoke_text_widget_redo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Command-y>",
-                    lambda event: (self._invoke_text_widget_redo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Control-Y>",
-                    lambda event: (self._invoke_text_widget_redo(event), "break")[1],
-                )
-                notes_text.bind(
-                    "<Command-Y>",
-                    lambda event: (self._invoke_text_widget_redo(event), "break")[1],
-                )
 
-                orders_list = tk.Listbox(
-                    cell_frame,
-                    height=3,
-                    activestyle="none",
-                    exportselection=False,
-                    selectmode=tk.EXTENDED,
-                )
-                orders_list.configure(
-                    bg=orders_bg,
-                    fg=orders_fg,
-                    highlightbackground=ACCENT_COLOR,
-                    highlightcolor=ACCENT_COLOR,
-                    selectbackground="#1e90ff",
-                    selectforeground=TEXT_COLOR,
-                    relief="flat",
-                    bd=0,
-                )
-                orders_list.grid(row=2, column=0, sticky="nsew", padx=4, pady=(0, 4))
+                # Restores the grid options if the cell was hidden for a
+                # shorter month.
+                cell_frame.grid()
 
                 day_cell = DayCell(
                     frame=cell_frame,
@@ -1667,80 +2071,88 @@ class YBSApp:
                     notes_fg=notes_fg,
                     orders_bg=orders_bg,
                     orders_fg=orders_fg,
+                    border_color=border_color,
+                    border_thickness=border_thickness,
+                    is_today=is_today,
+                    in_current_month=is_current_month,
                 )
-                day_cell.border_color = border_color
-                day_cell.border_thickness = border_thickness
-                day_cell.is_today = is_today
-                day_cell.in_current_month = is_current_month
-                self._day_cells[date_key] = day_cell
+                day_cells[date_key] = day_cell
+                for widget in (cell_frame, header_label, notes_text, orders_list):
+                    widget_date_keys[widget] = date_key
 
-                existing_notes = self._calendar_notes.get(date_key, "")
+                notes_text.delete("1.0", tk_end)
+                existing_notes = calendar_notes.get(date_key, "")
                 if existing_notes:
                     notes_text.insert("1.0", existing_notes)
+                # Start each day with a fresh widget undo history so Ctrl+Z
+                # cannot bring back text typed into the previous month's day.
+                notes_text.edit_reset()
+                notes_text.edit_modified(False)
+                orders_list.selection_clear(0, tk_end)
 
-                notes_text.bind(
-                    "<FocusOut>",
-                    lambda event, key=date_key: self._save_day_notes(key),
-                )
-
-                cell_frame.bind(
-                    "<Double-Button-1>",
-                    lambda event, key=date_key: self._open_day_details(key),
-                )
-                notes_text.bind(
-                    "<Double-Button-1>",
-                    lambda event, key=date_key: self._open_day_details(key),
-                )
-                orders_list.bind(
-                    "<Double-Button-1>",
-                    lambda event, key=date_key: self._open_day_details(key),
-                )
-                orders_list.bind(
-                    "<Delete>",
-                    lambda event, key=date_key: self._on_day_order_delete(event, key),
-                )
-                orders_list.bind(
-                    "<ButtonPress-1>",
-                    lambda event, key=date_key: self._on_day_order_press(event, key),
-                )
-                orders_list.bind(
-                    "<B1-Motion>",
-                    lambda event, key=date_key: self._on_day_order_drag(event, key),
-                )
-                orders_list.bind(
-                    "<ButtonRelease-1>",
-                    lambda event, key=date_key: self._on_day_order_release(event, key),
-                )
-                orders_list.bind(
-                    "<KeyPress-Up>",
-                    lambda event, key=date_key: self._on_day_order_key_navigate(
-                        event, key, -1
-                    ),
-                )
-                orders_list.bind(
-                    "<KeyPress-Left>",
-                    lambda event, key=date_key: self._on_day_order_key_navigate(
-                        event, key, -1
-                    ),
-                )
-                orders_list.bind(
-                    "<KeyPress-Down>",
-                    lambda event, key=date_key: self._on_day_order_key_navigate(
-                        event, key, 1
-                    ),
-                )
-                orders_list.bind(
-                    "<KeyPress-Right>",
-                    lambda event, key=date_key: self._on_day_order_key_navigate(
-                        event, key, 1
-                    ),
-                )
+                # Orders, header text and colors are filled in one idle pass
+                # once every cell has been re-keyed.
+                self._queue_day_cell_display(date_key)
 
-                self._update_day_cell_display(date_key)
+        for cell_frame, *_ in cell_widgets[cell_index:]:
+            cell_frame.grid_remove()
 
         self._calendar_hover = None
         self._set_active_day_header(previous_active)
 
+    def _create_day_cell_bindings(
+        self,
+    ) -> Dict[str, Tuple[Tuple[str, Callable[[tk.Event], object]], ...]]:
+        """Build the event bindings shared by every day cell, keyed by widget role."""
+
+        def for_day(
+            handler: Callable[..., object], *args: object, with_event: bool = True
+        ) -> Callable[[tk.Event], object]:
+            def callback(event: tk.Event) -> object:
+                date_key = self._widget_date_keys.get(event.widget)
+                if date_key is None:
+                    return None
+                if with_event:
+                    return handler(event, date_key, *args)
+                return handler(date_key, *args)
+
+            return callback
+
+        pointer_enter = for_day(self._on_day_cell_pointer_enter)
+        pointer_leave = for_day(self._on_day_cell_pointer_leave)
+        open_details = for_day(self._open_day_details, with_event=False)
+        return {
+            "frame": (
+                ("<Enter>", pointer_enter),
+                ("<Leave>", pointer_leave),
+                ("<Double-Button-1>", open_details),
+            ),
+            "header": (
+                ("<Button-1>", for_day(self._on_day_header_click)),
+                ("<FocusIn>", for_day(self._on_day_header_focus, with_event=False)),
+                ("<Delete>", for_day(self._on_day_clear_request)),
+                ("<Destroy>", for_day(self._on_day_header_destroy)),
+                ("<Enter>", pointer_enter),
+                ("<Leave>", pointer_leave),
+            ),
+            "notes": (
+                ("<FocusOut>", for_day(self._on_day_notes_focus_out)),
+                ("<<Modified>>", for_day(self._on_day_notes_modified)),
+                ("<Double-Button-1>", open_details),
+            ),
+            "orders": (
+                ("<Double-Button-1>", open_details),
+                ("<Delete>", for_day(self._on_day_order_delete)),
+                ("<ButtonPress-1>", for_day(self._on_day_order_press)),
+                ("<B1-Motion>", for_day(self._on_day_order_drag)),
+                ("<ButtonRelease-1>", for_day(self._on_day_order_release)),
+                ("<KeyPress-Up>", for_day(self._on_day_order_key_navigate, -1)),
+                ("<KeyPress-Left>", for_day(self._on_day_order_key_navigate, -1)),
+                ("<KeyPress-Down>", for_day(self._on_day_order_key_navigate, 1)),
+                ("<KeyPress-Right>", for_day(self._on_day_order_key_navigate, 1)),
+            ),
+        }
+
     def _refresh_day_header_selection(
         self, previous_active: DateKey | None = None
     ) -> None:
@@ -1804,33 +2216,50 @@ class YBSApp:
             self._set_status(FAIL_COLOR, "No orders scheduled for this day.")
             return
 
-        snapshot = self._capture_assignments_state(date_key)
         self._push_undo_action(
-            {"kind": "assignments", "dates": {date_key: snapshot}}
+            AssignmentsAction(
+                dates={
+                    date_key: AssignmentsDiff(
+                        removed=list(enumerate(assignments)), added=[]
+                    )
+                }
+            )
         )
         removed_count = len(assignments)
         self._calendar_assignments.pop(date_key, None)
         self._update_day_cell_display(date_key)
-        self._schedule_state_save()
+        self._schedule_state_save(date_key)
 
         date_label_text = self._format_date_label(date_key)
         plural = "s" if removed_count != 1 else ""
         message = f"Cleared {removed_count} order{plural} from {date_label_text}."
         self._set_status(SUCCESS_COLOR, message)
 
+    def _configure_cell_widget(self, widget: tk.Misc, **options: object) -> None:
+        """Apply ``options`` to a day cell widget, skipping values it already has.
+
+        Every styling change to the day cell widgets goes through here so the
+        recorded options always match what Tk is displaying.
+        """
+
+        applied = self._cell_widget_options.setdefault(widget, {})
+        changed = {
+            name: value for name, value in options.items() if applied.get(name) != value
+        }
+        if changed:
+            widget.configure(**changed)
+            applied.update(changed)
+
     def _apply_day_cell_base_style(self, date_key: DateKey) -> None:
+        # No winfo_exists() probe up front: when nothing changed the widget
+        # setters below make no Tcl calls at all, and a destroyed cell still
+        # surfaces as the TclError they already handle.
         day_cell = self._day_cells.get(date_key)
         if not day_cell:
             return
 
-        try:
-            if not day_cell.frame.winfo_exists():
-                return
-        except tk.TclError:
-            return
-
-        border_color = getattr(day_cell, "border_color", ACCENT_COLOR)
-        border_thickness = getattr(day_cell, "border_thickness", 1)
+        border_color = day_cell.border_color
+        border_thickness = day_cell.border_thickness
         is_active = self._active_day_header == date_key
 
         if is_active:
@@ -1838,7 +2267,8 @@ class YBSApp:
             border_thickness = max(border_thickness, 3)
 
         try:
-            day_cell.frame.configure(
+            self._configure_cell_widget(
+                day_cell.frame,
                 bg=day_cell.default_bg,
                 highlightbackground=border_color,
                 highlightcolor=border_color,
@@ -1847,27 +2277,27 @@ class YBSApp:
         except tk.TclError:
             return
 
-        assignments = self._calendar_assignments.get(date_key, [])
+        assignments = self._calendar_assignments.get(date_key) or ()
         has_assignments = bool(assignments)
 
-        base_header_fg = getattr(day_cell, "header_fg", TEXT_COLOR)
-        base_orders_fg = getattr(day_cell, "orders_fg", TEXT_COLOR)
-        base_notes_bg = getattr(day_cell, "notes_bg", NOTES_TEXT_BACKGROUND)
-        base_notes_fg = getattr(day_cell, "notes_fg", TEXT_COLOR)
-        base_orders_bg = getattr(day_cell, "orders_bg", ORDERS_LIST_BACKGROUND)
+        base_header_fg = day_cell.header_fg
+        base_orders_fg = day_cell.orders_fg
+        base_notes_bg = day_cell.notes_bg
+        base_notes_fg = day_cell.notes_fg
+        base_orders_bg = day_cell.orders_bg
 
         header_bg: str
         header_fg: str
         orders_bg: str
         orders_fg: str
 
-        if has_assignments and getattr(day_cell, "in_current_month", True):
+        if has_assignments and day_cell.in_current_month:
             header_bg = ASSIGNMENT_HEADER_BACKGROUND
             header_fg = TEXT_COLOR
             orders_bg = ASSIGNMENT_LIST_BACKGROUND
             orders_fg = TEXT_COLOR
         else:
-            if getattr(day_cell, "is_today", False):
+            if day_cell.is_today:
                 header_bg = TODAY_HEADER_BACKGROUND
                 header_fg = TEXT_COLOR
             else:
@@ -1881,17 +2311,22 @@ class YBSApp:
             header_fg = TEXT_COLOR
 
         try:
-            day_cell.header_label.configure(bg=header_bg, fg=header_fg)
+            self._configure_cell_widget(
+                day_cell.header_label, bg=header_bg, fg=header_fg
+            )
         except tk.TclError:
             return
 
         try:
-            day_cell.orders_list.configure(bg=orders_bg, fg=orders_fg)
+            self._configure_cell_widget(
+                day_cell.orders_list, bg=orders_bg, fg=orders_fg
+            )
         except tk.TclError:
             return
 
         try:
-            day_cell.notes_text.configure(
+            self._configure_cell_widget(
+                day_cell.notes_text,
                 bg=base_notes_bg,
                 fg=base_notes_fg,
                 insertbackground=base_notes_fg,
@@ -1901,7 +2336,7 @@ class YBSApp:
 
         if (
             self._day_cell_pointer_hover == date_key
-            and not self._drag_data.get("active")
+            and not self._drag_data.active
             and self._calendar_hover != date_key
             and self._is_pointer_over_day_cell(day_cell)
         ):
@@ -1910,7 +2345,7 @@ class YBSApp:
     def _on_day_cell_pointer_enter(
         self, event: tk.Event | None, date_key: DateKey
     ) -> None:
-        if self._drag_data.get("active"):
+        if self._drag_data.active:
             return
         self._apply_day_cell_pointer_hover(date_key, check_pointer=False)
 
@@ -1940,7 +2375,7 @@ class YBSApp:
         if self._day_cell_pointer_hover == date_key:
             self._day_cell_pointer_hover = None
 
-        if self._calendar_hover == date_key and self._drag_data.get("active"):
+        if self._calendar_hover == date_key and self._drag_data.active:
             return
 
         self._apply_day_cell_base_style(date_key)
@@ -1951,13 +2386,10 @@ class YBSApp:
         if widget is None or day_cell is None:
             return False
 
-        frame = day_cell.frame
-        current = widget
-        while current is not None:
-            if current == frame:
-                return True
-            current = getattr(current, "master", None)
-        return False
+        # Every widget of a visible cell is registered with its day, so
+        # membership is a lookup rather than a walk up the master chain.
+        date_key = self._widget_date_keys.get(widget)
+        return date_key is not None and self._day_cells.get(date_key) is day_cell
 
     def _is_pointer_over_day_cell(self, day_cell: DayCell) -> bool:
         try:
@@ -1975,7 +2407,7 @@ class YBSApp:
     def _apply_day_cell_pointer_hover(
         self, date_key: DateKey, *, check_pointer: bool = True
     ) -> None:
-        if self._drag_data.get("active"):
+        if self._drag_data.active:
             return
 
         if self._calendar_hover == date_key:
@@ -1994,33 +2426,56 @@ class YBSApp:
         if check_pointer and not self._is_pointer_over_day_cell(day_cell):
             return
 
-        border_color = getattr(day_cell, "border_color", ACCENT_COLOR)
-        border_thickness = getattr(day_cell, "border_thickness", 1)
+        border_color = day_cell.border_color
+        border_thickness = day_cell.border_thickness
         if self._active_day_header == date_key:
             border_color = ACTIVE_DAY_BORDER_COLOR
             border_thickness = max(border_thickness, 3)
 
         try:
-            day_cell.frame.configure(
+            self._configure_cell_widget(
+                day_cell.frame,
                 bg=DAY_CELL_HOVER_VALID,
                 highlightbackground=border_color,
                 highlightcolor=border_color,
                 highlightthickness=border_thickness,
             )
             header_hover_fg = (
-                TEXT_COLOR
-                if getattr(day_cell, "in_current_month", True)
-                else getattr(day_cell, "header_fg", ADJACENT_MONTH_TEXT_COLOR)
+                TEXT_COLOR if day_cell.in_current_month else day_cell.header_fg
             )
-            day_cell.header_label.configure(
-                bg=DAY_CELL_HOVER_VALID, fg=header_hover_fg
+            self._configure_cell_widget(
+                day_cell.header_label, bg=DAY_CELL_HOVER_VALID, fg=header_hover_fg
             )
         except tk.TclError:
             return
 
         self._day_cell_pointer_hover = date_key
 
+    def _on_day_notes_modified(self, event: tk.Event, date_key: DateKey) -> None:
+        widget = event.widget
+        try:
+            if not widget.edit_modified():
+                return
+            # Re-arm the flag so the next edit raises <<Modified>> again.
+            widget.edit_modified(False)
+        except tk.TclError:
+            return
+        self._dirty_note_keys.add(date_key)
+
+    def _on_day_notes_focus_out(self, event: tk.Event, date_key: DateKey) -> None:
+        # Skip reading the whole buffer back when focus merely passed through.
+        # The widget's own flag covers an edit whose <<Modified>> is still
+        # queued behind this FocusOut.
+        if date_key not in self._dirty_note_keys:
+            try:
+                if not event.widget.edit_modified():
+                    return
+            except tk.TclError:
+                return
+        self._save_day_notes(date_key)
+
     def _save_day_notes(self, date_key: DateKey) -> None:
+        self._dirty_note_keys.discard(date_key)
         day_cell = self._day_cells.get(date_key)
         if not day_cell:
             return
@@ -2036,22 +2491,14 @@ class YBSApp:
         elif existing_text is None:
             return
 
-        snapshot = self._capture_notes_state(date_key)
-        self._push_undo_action(
-            {
-                "kind": "notes",
-                "date_key": date_key,
-                "previous": snapshot.get("previous"),
-                "had_key": snapshot.get("had_key"),
-            }
-        )
+        self._push_undo_action(self._capture_notes_state(date_key))
 
         if has_new_text:
             self._calendar_notes[date_key] = new_text
         else:
             self._calendar_notes.pop(date_key, None)
 
-        self._schedule_state_save()
+        self._schedule_state_save(date_key)
 
     def _on_day_order_delete(
         self, event: tk.Event | None, date_key: DateKey
@@ -2062,7 +2509,7 @@ class YBSApp:
 
         orders_list = day_cell.orders_list
         selection = orders_list.curselection()
-        assignments = self._calendar_assignments.get(date_key, [])
+        assignments = self._calendar_assignments.get(date_key) or ()
 
         if not assignments:
             orders_list.selection_clear(0, tk.END)
@@ -2093,60 +2540,141 @@ class YBSApp:
             )
             return
 
-        snapshot = self._capture_assignments_state(date_key)
-        self._push_undo_action(
-            {"kind": "assignments", "dates": {date_key: snapshot}}
-        )
-
         removed_assignments: list[Tuple[str, str]] = []
         for index in reversed(valid_indices):
             removed_assignments.append(assignments.pop(index))
         removed_assignments.reverse()
 
+        self._push_undo_action(
+            AssignmentsAction(
+                dates={
+                    date_key: AssignmentsDiff(
+                        removed=list(zip(valid_indices, removed_assignments)),
+                        added=[],
+                    )
+                }
+            )
+        )
+
         if assignments:
             self._calendar_assignments[date_key] = assignments
         else:
             self._calendar_assignments.pop(date_key, None)
 
-        orders_list.selection_clear(0, tk.END)
-        self._update_day_cell_display(date_key)
-        self._schedule_state_save()
+        orders_list.selection_clear(0, tk.END)
+        self._update_day_cell_display(date_key)
+        self._schedule_state_save(date_key)
+
+        message = self._format_bulk_removal_message(date_key, removed_assignments)
+        self._set_status(SUCCESS_COLOR, message)
+
+    def _open_day_details(self, date_key: DateKey) -> None:
+        day_cell = self._day_cells.get(date_key)
+        cell_bounds: tuple[int, int, int, int] | None = None
+        if day_cell is not None:
+            cell_widget = day_cell.frame
+            if cell_widget is not None:
+                try:
+                    if cell_widget.winfo_exists():
+                        if cell_widget.winfo_ismapped():
+                            cell_widget.update_idletasks()
+                        else:
+                            self.root.update_idletasks()
+                        cell_x = cell_widget.winfo_rootx()
+                        cell_y = cell_widget.winfo_rooty()
+                        cell_width = cell_widget.winfo_width()
+                        cell_height = cell_widget.winfo_height()
+                        if cell_width <= 1:
+                            cell_width = cell_widget.winfo_reqwidth()
+                        if cell_height <= 1:
+                            cell_height = cell_widget.winfo_reqheight()
+                        cell_bounds = (
+                            cell_x,
+                            cell_y,
+                            max(int(cell_width), 1),
+                            max(int(cell_height), 1),
+                        )
+                except tk.TclError:
+                    cell_bounds = None
+
+        dialog = self._day_details_dialog
+        try:
+            dialog_exists = dialog is not None and bool(dialog.window.winfo_exists())
+        except tk.TclError:
+            dialog_exists = False
+        if dialog is None or not dialog_exists:
+            dialog = self._build_day_details_dialog()
+            self._day_details_dialog = dialog
+
+        window = dialog.window
+        self._day_details_date_key = date_key
+        date_label_text = self._format_date_label(date_key)
+        window.title(date_label_text)
+        dialog.date_label.configure(text=f"Orders for {date_label_text}")
+
+        dialog.refresh_list()
+        # Only the first opening has to flush pending geometry to learn the
+        # window's size; later ones reuse it, as the layout is fixed.
+        if dialog.size is None:
+            window.update_idletasks()
+            try:
+                self.root.update_idletasks()
+            except tk.TclError:
+                pass
+        try:
+            root_x = int(self.root.winfo_rootx())
+            root_y = int(self.root.winfo_rooty())
+            root_width = int(self.root.winfo_width())
+            root_height = int(self.root.winfo_height())
+        except tk.TclError:
+            root_x = root_y = 0
+            root_width = root_height = 0
+        else:
+            if root_width <= 1:
+                root_width = int(self.root.winfo_reqwidth())
+            if root_height <= 1:
+                root_height = int(self.root.winfo_reqheight())
+
+        if dialog.size is None:
+            window_width = int(window.winfo_width())
+            window_height = int(window.winfo_height())
+            if window_width <= 1:
+                window_width = int(window.winfo_reqwidth())
+            if window_height <= 1:
+                window_height = int(window.winfo_reqheight())
+            dialog.size = (window_width, window_height)
+        window_width, window_height = dialog.size
+
+        if cell_bounds is not None:
+            cell_x, cell_y, cell_width, cell_height = cell_bounds
+            target_x = int(cell_x + (cell_width - window_width) / 2)
+            target_y = int(cell_y + (cell_height - window_height) / 2)
+        elif root_width > 0 and root_height > 0:
+            target_x = int(root_x + (root_width - window_width) / 2)
+            target_y = int(root_y + (root_height - window_height) / 2)
+        else:
+            target_x = int(root_x)
+            target_y = int(root_y)
+
+        target_x, target_y = self._constrain_to_monitor(
+            target_x,
+            target_y,
+            window_width,
+            window_height,
+        )
+        window.geometry(f"+{target_x}+{target_y}")
+        window.deiconify()
+        window.focus_set()
 
-        message = self._format_bulk_removal_message(date_key, removed_assignments)
-        self._set_status(SUCCESS_COLOR, message)
+    def _build_day_details_dialog(self) -> DayDetailsDialog:
+        """Create the day details window, which is reused for every day.
 
-    def _open_day_details(self, date_key: DateKey) -> None:
-        day_cell = self._day_cells.get(date_key)
-        cell_bounds: tuple[int, int, int, int] | None = None
-        if day_cell is not None:
-            cell_widget = getattr(day_cell, "frame", None)
-            if cell_widget is not None:
-                try:
-                    if cell_widget.winfo_exists():
-                        if cell_widget.winfo_ismapped():
-                            cell_widget.update_idletasks()
-                        else:
-                            self.root.update_idletasks()
-                        cell_x = cell_widget.winfo_rootx()
-                        cell_y = cell_widget.winfo_rooty()
-                        cell_width = cell_widget.winfo_width()
-                        cell_height = cell_widget.winfo_height()
-                        if cell_width <= 1:
-                            cell_width = cell_widget.winfo_reqwidth()
-                        if cell_height <= 1:
-                            cell_height = cell_widget.winfo_reqheight()
-                        cell_bounds = (
-                            cell_x,
-                            cell_y,
-                            max(int(cell_width), 1),
-                            max(int(cell_height), 1),
-                        )
-                except tk.TclError:
-                    cell_bounds = None
+        Its actions always work on ``self._day_details_date_key``, the day
+        the window was last opened for.
+        """
 
         window = tk.Toplevel(self.root)
         window.withdraw()
-        window.title(self._format_date_label(date_key))
         window.configure(bg=BACKGROUND_COLOR)
         window.transient(self.root)
         window.resizable(False, False)
@@ -2154,11 +2682,7 @@ class YBSApp:
         frame = ttk.Frame(window, style="Dark.TFrame", padding=20)
         frame.pack(fill=tk.BOTH, expand=True)
 
-        date_label = ttk.Label(
-            frame,
-            text=f"Orders for {self._format_date_label(date_key)}",
-            style="Dark.TLabel",
-        )
+        date_label = ttk.Label(frame, style="Dark.TLabel")
         date_label.grid(row=0, column=0, columnspan=2, sticky="w")
 
         info_var = tk.StringVar(value="")
@@ -2193,7 +2717,8 @@ class YBSApp:
         frame.rowconfigure(2, weight=1)
 
         def update_button_states(*_: object) -> None:
-            assignments = self._calendar_assignments.get(date_key, [])
+            date_key = self._day_details_date_key
+            assignments = self._calendar_assignments.get(date_key) or ()
             has_assignments = bool(assignments)
             info_var.set("" if has_assignments else "No orders scheduled for this day.")
             clear_state = tk.NORMAL if has_assignments else tk.DISABLED
@@ -2204,10 +2729,11 @@ class YBSApp:
                 remove_button.config(state=tk.DISABLED)
 
         def refresh_list(select_index: int | None = None) -> None:
-            assignments = self._calendar_assignments.get(date_key, [])
+            assignments = (
+                self._calendar_assignments.get(self._day_details_date_key) or ()
+            )
             listbox.delete(0, tk.END)
-            for assignment in assignments:
-                listbox.insert(tk.END, self._format_assignment_label(assignment))
+            listbox.insert(tk.END, *map(self._format_assignment_label, assignments))
             listbox.selection_clear(0, tk.END)
             if (
                 select_index is not None
@@ -2218,13 +2744,16 @@ class YBSApp:
             update_button_states()
 
         def remove_selected() -> None:
+            date_key = self._day_details_date_key
+            if date_key is None:
+                return
             selection = listbox.curselection()
             if not selection:
                 self._set_status(FAIL_COLOR, "Please select an order to remove.")
                 return
 
             index = selection[0]
-            assignments = self._calendar_assignments.get(date_key, [])
+            assignments = self._calendar_assignments.get(date_key) or ()
             if not assignments:
                 self._set_status(FAIL_COLOR, "No orders scheduled for this day.")
                 refresh_list()
@@ -2235,18 +2764,23 @@ class YBSApp:
                 update_button_states()
                 return
 
-            snapshot = self._capture_assignments_state(date_key)
+            removed_assignment = assignments.pop(index)
             self._push_undo_action(
-                {"kind": "assignments", "dates": {date_key: snapshot}}
+                AssignmentsAction(
+                    dates={
+                        date_key: AssignmentsDiff(
+                            removed=[(index, removed_assignment)], added=[]
+                        )
+                    }
+                )
             )
-            removed_assignment = assignments.pop(index)
             if assignments:
                 self._calendar_assignments[date_key] = assignments
             else:
                 self._calendar_assignments.pop(date_key, None)
 
             self._update_day_cell_display(date_key)
-            self._schedule_state_save()
+            self._schedule_state_save(date_key)
             next_index = min(index, len(assignments) - 1)
             refresh_list(select_index=next_index if assignments else None)
 
@@ -2254,20 +2788,28 @@ class YBSApp:
             self._set_status(SUCCESS_COLOR, message)
 
         def clear_day() -> None:
-            assignments = self._calendar_assignments.get(date_key, [])
+            date_key = self._day_details_date_key
+            if date_key is None:
+                return
+            assignments = self._calendar_assignments.get(date_key) or ()
             if not assignments:
                 self._set_status(FAIL_COLOR, "No orders scheduled for this day.")
                 refresh_list()
                 return
 
-            snapshot = self._capture_assignments_state(date_key)
             self._push_undo_action(
-                {"kind": "assignments", "dates": {date_key: snapshot}}
+                AssignmentsAction(
+                    dates={
+                        date_key: AssignmentsDiff(
+                            removed=list(enumerate(assignments)), added=[]
+                        )
+                    }
+                )
             )
             removed_count = len(assignments)
             self._calendar_assignments.pop(date_key, None)
             self._update_day_cell_display(date_key)
-            self._schedule_state_save()
+            self._schedule_state_save(date_key)
             refresh_list()
 
             date_label_text = self._format_date_label(date_key)
@@ -2277,7 +2819,8 @@ class YBSApp:
             close_dialog()
 
         def close_dialog() -> None:
-            window.destroy()
+            self._day_details_date_key = None
+            window.withdraw()
 
         remove_button = ttk.Button(
             button_frame,
@@ -2306,53 +2849,12 @@ class YBSApp:
         listbox.bind("<<ListboxSelect>>", update_button_states)
         window.protocol("WM_DELETE_WINDOW", close_dialog)
 
-        refresh_list()
-        window.update_idletasks()
-        try:
-            self.root.update_idletasks()
-        except tk.TclError:
-            pass
-        try:
-            root_x = int(self.root.winfo_rootx())
-            root_y = int(self.root.winfo_rooty())
-            root_width = int(self.root.winfo_width())
-            root_height = int(self.root.winfo_height())
-        except tk.TclError:
-            root_x = root_y = 0
-            root_width = root_height = 0
-        else:
-            if root_width <= 1:
-                root_width = int(self.root.winfo_reqwidth())
-            if root_height <= 1:
-                root_height = int(self.root.winfo_reqheight())
-
-        window_width = int(window.winfo_width())
-        window_height = int(window.winfo_height())
-        if window_width <= 1:
-            window_width = int(window.winfo_reqwidth())
-        if window_height <= 1:
-            window_height = int(window.winfo_reqheight())
-
-        if cell_bounds is not None:
-            cell_x, cell_y, cell_width, cell_height = cell_bounds
-            target_x = int(cell_x + (cell_width - window_width) / 2)
-            target_y = int(cell_y + (cell_height - window_height) / 2)
-        elif root_width > 0 and root_height > 0:
-            target_x = int(root_x + (root_width - window_width) / 2)
-            target_y = int(root_y + (root_height - window_height) / 2)
-        else:
-            target_x = int(root_x)
-            target_y = int(root_y)
-
-        target_x, target_y = self._constrain_to_monitor(
-            target_x,
-            target_y,
-            window_width,
-            window_height,
+        return DayDetailsDialog(
+            window=window,
+            date_label=date_label,
+            refresh_list=refresh_list,
+            size=None,
         )
-        window.geometry(f"+{target_x}+{target_y}")
-        window.deiconify()
-        window.focus_set()
 
     def _change_month(self, delta_months: int) -> None:
         year = self._current_year
@@ -2378,32 +2880,31 @@ class YBSApp:
         self._render_calendar()
 
     def _reset_drag_state(self) -> None:
-        self._drag_data = {
-            "items": (),
-            "values": (),
-            "start_x": 0,
-            "start_y": 0,
-            "widget": None,
-            "active": False,
-            "source": None,
-            "source_date_key": None,
-            "source_indices": (),
-            "source_assignments": (),
-            "selection_snapshot": (),
-            "selection_anchor": None,
-            "focus_item": None,
-            "active_index": None,
-            "clicked_item": None,
-        }
+        self._drag_data.reset()
+
+    @staticmethod
+    def _select_listbox_indices(listbox: tk.Listbox, indices: Iterable[int]) -> None:
+        """Select ``indices`` with one call per run of consecutive rows."""
+
+        run_start = run_end = None
+        for index in sorted(set(indices)):
+            if run_end is not None and index == run_end + 1:
+                run_end = index
+                continue
+            if run_start is not None:
+                listbox.selection_set(run_start, run_end)
+            run_start = run_end = index
+        if run_start is not None:
+            listbox.selection_set(run_start, run_end)
 
     def _restore_drag_selection(self) -> None:
-        snapshot = self._drag_data.get("selection_snapshot")
+        snapshot = self._drag_data.selection_snapshot
         if not isinstance(snapshot, (tuple, list)):
             return
 
-        source = self._drag_data.get("source")
+        source = self._drag_data.source
         if source == "tree":
-            children = list(self.tree.get_children(""))
+            children = self._tree_child_index
             preserved = [item for item in snapshot if item in children]
             try:
                 if preserved:
@@ -2413,22 +2914,22 @@ class YBSApp:
             except tk.TclError:
                 return
 
-            focus_item = self._drag_data.get("focus_item")
+            focus_item = self._drag_data.focus_item
             if isinstance(focus_item, str) and focus_item in children:
                 try:
                     self.tree.focus(focus_item)
                 except tk.TclError:
                     pass
 
-            anchor = self._drag_data.get("selection_anchor")
+            anchor = self._drag_data.selection_anchor
             if isinstance(anchor, str) and anchor in children:
                 self._tree_selection_anchor = anchor
             elif not preserved:
                 self._tree_selection_anchor = None
         elif source == "calendar":
-            date_key = self._drag_data.get("source_date_key")
+            date_key = self._drag_data.source_date_key
             day_cell = self._day_cells.get(date_key) if date_key is not None else None
-            orders_list = getattr(day_cell, "orders_list", None)
+            orders_list = day_cell.orders_list if day_cell is not None else None
             if orders_list is None:
                 return
 
@@ -2437,17 +2938,18 @@ class YBSApp:
             except tk.TclError:
                 return
 
+            indices: list[int] = []
             for raw_index in snapshot:
                 try:
-                    index = int(raw_index)
+                    indices.append(int(raw_index))
                 except (TypeError, ValueError):
                     continue
-                try:
-                    orders_list.selection_set(index)
-                except tk.TclError:
-                    continue
+            try:
+                self._select_listbox_indices(orders_list, indices)
+            except tk.TclError:
+                pass
 
-            anchor_index = self._drag_data.get("selection_anchor")
+            anchor_index = self._drag_data.selection_anchor
             try:
                 anchor_value = int(anchor_index)
             except (TypeError, ValueError):
@@ -2459,7 +2961,7 @@ class YBSApp:
                 except tk.TclError:
                     pass
 
-            active_index = self._drag_data.get("active_index")
+            active_index = self._drag_data.active_index
             try:
                 active_value = int(active_index)
             except (TypeError, ValueError):
@@ -2482,15 +2984,13 @@ class YBSApp:
     def _navigate_tree_with_keyboard(
         self, direction: int, event: tk.Event | None
     ) -> str | None:
-        children = list(self.tree.get_children(""))
+        children = self._tree_children
         if not children:
             return "break"
 
-        focus_item = self.tree.focus()
-        if focus_item not in children:
+        focus_index = self._tree_child_index.get(self.tree.focus())
+        if focus_index is None:
             focus_index = 0 if direction >= 0 else len(children) - 1
-        else:
-            focus_index = children.index(focus_item)
 
         new_index = focus_index + direction
         new_index = max(0, min(new_index, len(children) - 1))
@@ -2519,9 +3019,9 @@ class YBSApp:
         return "break"
 
     def _refresh_tree_drag_selection(self) -> None:
-        if self._drag_data.get("source") != "tree":
+        if self._drag_data.source != "tree":
             return
-        if self._drag_data.get("active"):
+        if self._drag_data.active:
             return
 
         tree = getattr(self, "tree", None)
@@ -2533,21 +3033,20 @@ class YBSApp:
         except tk.TclError:
             selection = ()
 
+        # _apply_order_filter keeps the row index current, so existence and
+        # display order are answered without asking Tk row by row.
+        child_index = self._tree_child_index
+
         def item_exists(item_id: str | None) -> bool:
-            if not item_id:
-                return False
-            try:
-                return bool(tree.exists(item_id))
-            except tk.TclError:
-                return False
+            return item_id is not None and item_id in child_index
+
+        selected_items = [item for item in map(str, selection) if item in child_index]
+        selected_items.sort(key=child_index.__getitem__)
 
         valid_items: list[str] = []
         values: list[Tuple[object, ...]] = []
 
-        for raw_item in selection:
-            item = str(raw_item)
-            if not item_exists(item):
-                continue
+        for item in selected_items:
             try:
                 row_values = tree.item(item, "values")
             except tk.TclError:
@@ -2574,7 +3073,7 @@ class YBSApp:
             anchor_item = focus_item
 
         if not valid_items:
-            fallback_item = self._drag_data.get("clicked_item")
+            fallback_item = self._drag_data.clicked_item
             if item_exists(fallback_item):
                 try:
                     row_values = tree.item(fallback_item, "values")
@@ -2595,15 +3094,12 @@ class YBSApp:
                 if anchor_item is None and item_exists(fallback_item):
                     anchor_item = fallback_item
 
-        self._drag_data.update(
-            {
-                "items": tuple(valid_items),
-                "values": tuple(values),
-                "selection_snapshot": tuple(valid_items),
-                "focus_item": focus_item,
-                "selection_anchor": anchor_item,
-            }
-        )
+        drag_data = self._drag_data
+        drag_data.items = tuple(valid_items)
+        drag_data.values = tuple(values)
+        drag_data.selection_snapshot = tuple(valid_items)
+        drag_data.focus_item = focus_item
+        drag_data.selection_anchor = anchor_item
 
     def _on_order_press(self, event: tk.Event) -> None:
         self._end_drag()
@@ -2640,22 +3136,19 @@ class YBSApp:
         if not ctrl_pressed and not shift_pressed:
             self._tree_selection_anchor = clicked_item
 
-        self._drag_data.update(
-            {
-                "items": (),
-                "values": (),
-                "start_x": start_x,
-                "start_y": start_y,
-                "widget": None,
-                "active": False,
-                "source": "tree",
-                "selection_snapshot": (),
-                "selection_anchor": self._tree_selection_anchor,
-                "focus_item": None,
-                "active_index": None,
-                "clicked_item": clicked_item,
-            }
-        )
+        drag_data = self._drag_data
+        drag_data.items = ()
+        drag_data.values = ()
+        drag_data.start_x = start_x
+        drag_data.start_y = start_y
+        drag_data.widget = None
+        drag_data.active = False
+        drag_data.source = "tree"
+        drag_data.selection_snapshot = ()
+        drag_data.selection_anchor = self._tree_selection_anchor
+        drag_data.focus_item = None
+        drag_data.active_index = None
+        drag_data.clicked_item = clicked_item
 
         self._refresh_tree_drag_selection()
 
@@ -2667,17 +3160,15 @@ class YBSApp:
         return None
 
     def _on_order_drag(self, event: tk.Event) -> str | None:
-        if self._drag_data.get("source") != "tree":
+        if self._drag_data.source != "tree":
             return None
 
         self._refresh_tree_drag_selection()
 
-        items = self._drag_data.get("items")
+        items = self._drag_data.items
         if not isinstance(items, (tuple, list)) or not items:
             return None
 
-        self._restore_drag_selection()
-
         try:
             x_root = int(getattr(event, "x_root", 0))
         except (TypeError, ValueError):
@@ -2687,34 +3178,19 @@ class YBSApp:
         except (TypeError, ValueError):
             y_root = 0
 
-        drag_active = bool(self._drag_data.get("active"))
-        if not drag_active:
-            start_x = int(self._drag_data.get("start_x", x_root))
-            start_y = int(self._drag_data.get("start_y", y_root))
-            if (
-                abs(x_root - start_x) >= DRAG_THRESHOLD
-                or abs(y_root - start_y) >= DRAG_THRESHOLD
-            ):
-                self._begin_drag()
-                drag_active = bool(self._drag_data.get("active"))
-                if drag_active:
-                    self._restore_drag_selection()
-
-        if drag_active:
-            self._position_drag_window(x_root, y_root)
-
-        target_info = self._detect_calendar_target(x_root, y_root)
-        self._update_calendar_hover(target_info)
+        if not self._is_drag_motion_negligible(x_root, y_root):
+            self._queue_drag_motion(x_root, y_root)
         return "break"
 
     def _on_order_release(self, event: tk.Event) -> str | None:
-        drag_was_active = bool(self._drag_data.get("active"))
+        self._flush_drag_motion()
+        drag_was_active = self._drag_data.active
 
-        if self._drag_data.get("source") != "tree":
+        if self._drag_data.source != "tree":
             self._end_drag()
             return "break" if drag_was_active else None
 
-        items = self._drag_data.get("items")
+        items = self._drag_data.items
         if not isinstance(items, (tuple, list)) or not items:
             self._end_drag()
             return "break" if drag_was_active else None
@@ -2749,7 +3225,7 @@ class YBSApp:
                     normalized_key = None
 
         if normalized_key is not None:
-            raw_orders = self._drag_data.get("values", ())
+            raw_orders = self._drag_data.values
             if not isinstance(raw_orders, (tuple, list)) or not raw_orders:
                 self._queue.put(
                     (
@@ -2795,7 +3271,7 @@ class YBSApp:
             return "break"
 
         orders_list = day_cell.orders_list
-        assignments = self._calendar_assignments.get(date_key, [])
+        assignments = self._calendar_assignments.get(date_key) or ()
         try:
             normalized_date_key: DateKey = (
                 int(date_key[0]),
@@ -2807,25 +3283,22 @@ class YBSApp:
         if not assignments:
             orders_list.selection_clear(0, tk.END)
             self._day_selection_anchor.pop(normalized_date_key, None)
-            self._drag_data.update(
-                {
-                    "items": (),
-                    "values": (),
-                    "start_x": event.x_root,
-                    "start_y": event.y_root,
-                    "widget": None,
-                    "active": False,
-                    "source": "calendar",
-                    "source_date_key": date_key,
-                    "source_indices": (),
-                    "source_assignments": (),
-                    "selection_snapshot": (),
-                    "selection_anchor": None,
-                    "focus_item": None,
-                    "active_index": None,
-                    "clicked_item": None,
-                }
-            )
+            drag_data = self._drag_data
+            drag_data.items = ()
+            drag_data.values = ()
+            drag_data.start_x = event.x_root
+            drag_data.start_y = event.y_root
+            drag_data.widget = None
+            drag_data.active = False
+            drag_data.source = "calendar"
+            drag_data.source_date_key = date_key
+            drag_data.source_indices = ()
+            drag_data.source_assignments = ()
+            drag_data.selection_snapshot = ()
+            drag_data.selection_anchor = None
+            drag_data.focus_item = None
+            drag_data.active_index = None
+            drag_data.clicked_item = None
             return "break"
 
         try:
@@ -2859,8 +3332,7 @@ class YBSApp:
             start = min(anchor, index)
             end = max(anchor, index)
             orders_list.selection_clear(0, tk.END)
-            for idx in range(start, end + 1):
-                orders_list.selection_set(idx)
+            orders_list.selection_set(start, end)
             orders_list.selection_anchor(anchor)
         elif ctrl_pressed:
             if orders_list.selection_includes(index):
@@ -2894,25 +3366,22 @@ class YBSApp:
 
         assignments_tuple = tuple(normalized_assignments)
 
-        self._drag_data.update(
-            {
-                "items": selected_indices,
-                "values": assignments_tuple,
-                "start_x": event.x_root,
-                "start_y": event.y_root,
-                "widget": None,
-                "active": False,
-                "source": "calendar",
-                "source_date_key": normalized_date_key,
-                "source_indices": selected_indices,
-                "source_assignments": assignments_tuple,
-                "selection_snapshot": selected_indices,
-                "selection_anchor": anchor_value,
-                "focus_item": None,
-                "active_index": index,
-                "clicked_item": None,
-            }
-        )
+        drag_data = self._drag_data
+        drag_data.items = selected_indices
+        drag_data.values = assignments_tuple
+        drag_data.start_x = event.x_root
+        drag_data.start_y = event.y_root
+        drag_data.widget = None
+        drag_data.active = False
+        drag_data.source = "calendar"
+        drag_data.source_date_key = normalized_date_key
+        drag_data.source_indices = selected_indices
+        drag_data.source_assignments = assignments_tuple
+        drag_data.selection_snapshot = selected_indices
+        drag_data.selection_anchor = anchor_value
+        drag_data.focus_item = None
+        drag_data.active_index = index
+        drag_data.clicked_item = None
 
         return "break"
 
@@ -2980,8 +3449,7 @@ class YBSApp:
             start = min(anchor, target_index)
             end = max(anchor, target_index)
             orders_list.selection_clear(0, tk.END)
-            for idx in range(start, end + 1):
-                orders_list.selection_set(idx)
+            orders_list.selection_set(start, end)
             try:
                 orders_list.selection_anchor(anchor)
             except tk.TclError:
@@ -3015,39 +3483,22 @@ class YBSApp:
         return "break"
 
     def _on_day_order_drag(self, event: tk.Event, date_key: DateKey) -> str | None:
-        items = self._drag_data.get("items")
+        items = self._drag_data.items
         if not items:
             return None
 
-        self._restore_drag_selection()
-
         x_root = int(getattr(event, "x_root", 0))
         y_root = int(getattr(event, "y_root", 0))
 
-        drag_active = bool(self._drag_data.get("active"))
-        if not drag_active:
-            start_x = int(self._drag_data.get("start_x", x_root))
-            start_y = int(self._drag_data.get("start_y", y_root))
-            if (
-                abs(x_root - start_x) >= DRAG_THRESHOLD
-                or abs(y_root - start_y) >= DRAG_THRESHOLD
-            ):
-                self._begin_drag()
-                drag_active = bool(self._drag_data.get("active"))
-                if drag_active:
-                    self._restore_drag_selection()
-
-        if drag_active:
-            self._position_drag_window(x_root, y_root)
-
-        target_info = self._detect_calendar_target(x_root, y_root)
-        self._update_calendar_hover(target_info)
+        if not self._is_drag_motion_negligible(x_root, y_root):
+            self._queue_drag_motion(x_root, y_root)
         return "break"
 
     def _on_day_order_release(self, event: tk.Event, date_key: DateKey) -> str | None:
-        drag_was_active = bool(self._drag_data.get("active"))
+        self._flush_drag_motion()
+        drag_was_active = self._drag_data.active
 
-        if self._drag_data.get("source") != "calendar":
+        if self._drag_data.source != "calendar":
             self._end_drag()
             return "break" if drag_was_active else None
 
@@ -3060,11 +3511,11 @@ class YBSApp:
         except (TypeError, ValueError):
             normalized_date_key = date_key
 
-        if self._drag_data.get("source_date_key") != normalized_date_key:
+        if self._drag_data.source_date_key != normalized_date_key:
             self._end_drag()
             return "break" if drag_was_active else None
 
-        items = self._drag_data.get("items")
+        items = self._drag_data.items
         if not isinstance(items, (tuple, list)) or not items:
             self._end_drag()
             return "break" if drag_was_active else None
@@ -3090,7 +3541,7 @@ class YBSApp:
                     normalized_key = None
 
         if normalized_key is not None:
-            raw_orders = self._drag_data.get("values", ())
+            raw_orders = self._drag_data.values
             if not isinstance(raw_orders, (tuple, list)) or not raw_orders:
                 self._queue.put(
                     (
@@ -3106,7 +3557,7 @@ class YBSApp:
                     for order in raw_orders
                 )
 
-                raw_source_key = self._drag_data.get("source_date_key")
+                raw_source_key = self._drag_data.source_date_key
                 normalized_source: DateKey | None = None
                 if isinstance(raw_source_key, (tuple, list)) and len(raw_source_key) == 3:
                     try:
@@ -3141,15 +3592,13 @@ class YBSApp:
                 if normalized_source is not None:
                     payload["source_date_key"] = normalized_source
 
-                    source_indices = self._drag_data.get("source_indices", ())
+                    source_indices = self._drag_data.source_indices
                     if isinstance(source_indices, (tuple, list)):
                         payload["source_indices"] = tuple(
                             int(index) for index in source_indices
                         )
 
-                    source_assignments = self._drag_data.get(
-                        "source_assignments", ()
-                    )
+                    source_assignments = self._drag_data.source_assignments
                     if isinstance(source_assignments, (tuple, list)):
                         payload["source_orders"] = tuple(
                             self._normalize_assignment(order)
@@ -3170,9 +3619,79 @@ class YBSApp:
         self._end_drag()
         return "break"
 
+    def _queue_drag_motion(self, x_root: int, y_root: int) -> None:
+        """Handle the latest drag position at most once per DRAG_MOTION_INTERVAL_MS."""
+
+        self._drag_motion_xy = (x_root, y_root)
+        if self._drag_motion_after_id is not None:
+            return
+        try:
+            self._drag_motion_after_id = self.root.after(
+                DRAG_MOTION_INTERVAL_MS, self._on_drag_motion_due
+            )
+        except tk.TclError:
+            self._flush_drag_motion()
+
+    def _on_drag_motion_due(self) -> None:
+        self._drag_motion_after_id = None
+        self._flush_drag_motion()
+
+    def _cancel_drag_motion(self) -> None:
+        self._drag_motion_xy = None
+        if self._drag_motion_after_id is None:
+            return
+        try:
+            self.root.after_cancel(self._drag_motion_after_id)
+        except tk.TclError:
+            pass
+        self._drag_motion_after_id = None
+
+    def _flush_drag_motion(self) -> None:
+        pointer = self._drag_motion_xy
+        self._cancel_drag_motion()
+        if pointer is None or not self._drag_data.items:
+            return
+
+        x_root, y_root = pointer
+        self._restore_drag_selection()
+
+        drag_active = self._drag_data.active
+        if not drag_active:
+            start_x = self._drag_data.start_x
+            start_y = self._drag_data.start_y
+            if (
+                abs(x_root - start_x) >= DRAG_THRESHOLD
+                or abs(y_root - start_y) >= DRAG_THRESHOLD
+            ):
+                self._begin_drag()
+                drag_active = self._drag_data.active
+                if drag_active:
+                    self._restore_drag_selection()
+
+        if drag_active:
+            self._position_drag_window(x_root, y_root)
+
+        target_info = self._detect_calendar_target(x_root, y_root)
+        self._update_calendar_hover(target_info)
+
+    def _is_drag_motion_negligible(self, x_root: int, y_root: int) -> bool:
+        """Return True if an active drag has barely moved since its last redraw."""
+
+        drag_data = self._drag_data
+        if not drag_data.active:
+            return False
+
+        moved = abs(x_root - drag_data.last_x) + abs(y_root - drag_data.last_y)
+        if moved < DRAG_MOTION_THRESHOLD:
+            return True
+
+        drag_data.last_x = x_root
+        drag_data.last_y = y_root
+        return False
+
     def _begin_drag(self) -> None:
-        items = self._drag_data.get("items")
-        values = self._drag_data.get("values", ())
+        items = self._drag_data.items
+        values = self._drag_data.values
         if not items or not isinstance(values, (tuple, list)):
             return
 
@@ -3209,18 +3728,41 @@ class YBSApp:
         )
         label.pack()
 
-        self._drag_data["widget"] = drag_window
-        self._drag_data["values"] = tuple(normalized_orders)
-        self._drag_data["active"] = True
+        self._drag_data.widget = drag_window
+        self._drag_data.values = tuple(normalized_orders)
+        self._drag_data.active = True
 
-        start_x = int(self._drag_data.get("start_x", 0))
-        start_y = int(self._drag_data.get("start_y", 0))
+        start_x = self._drag_data.start_x
+        start_y = self._drag_data.start_y
+        self._drag_data.last_x = start_x
+        self._drag_data.last_y = start_y
         self._position_drag_window(start_x, start_y)
 
     def _position_drag_window(self, x_root: int, y_root: int) -> None:
-        widget = self._drag_data.get("widget")
+        widget = self._drag_data.widget
         if widget is None:
             return
+
+        # The drag label does not change during a drag, so it is measured
+        # once instead of flushing idle tasks on every motion event.
+        widget_size = self._drag_data.widget_size
+        if widget_size is None:
+            widget_size = self._measure_drag_window(widget)
+            self._drag_data.widget_size = widget_size
+        window_width, window_height = widget_size
+
+        base_x = int(x_root) + 16
+        base_y = int(y_root) + 16
+        target_x, target_y = self._constrain_to_monitor(
+            base_x,
+            base_y,
+            window_width,
+            window_height,
+        )
+        widget.geometry(f"+{target_x}+{target_y}")
+
+    @staticmethod
+    def _measure_drag_window(widget: tk.Misc) -> Tuple[int, int]:
         try:
             widget.update_idletasks()
         except tk.TclError:
@@ -3243,41 +3785,26 @@ class YBSApp:
             except (tk.TclError, ValueError):
                 window_height = 1
 
-        base_x = int(x_root) + 16
-        base_y = int(y_root) + 16
-        target_x, target_y = self._constrain_to_monitor(
-            base_x,
-            base_y,
-            window_width,
-            window_height,
-        )
-        widget.geometry(f"+{target_x}+{target_y}")
+        return window_width, window_height
 
     def _detect_calendar_target(self, x_root: int, y_root: int) -> Dict[str, object] | None:
-        try:
-            grid_x = self.calendar_grid.winfo_rootx()
-            grid_y = self.calendar_grid.winfo_rooty()
-            grid_width = self.calendar_grid.winfo_width()
-            grid_height = self.calendar_grid.winfo_height()
-        except tk.TclError:
-            return None
+        # The calendar does not move while orders are dragged over it, so its
+        # layout is measured once per drag and hit-tested in Python after that.
+        geometry = self._drag_data.calendar_geometry
+        if geometry is None:
+            geometry = self._measure_calendar_geometry()
+            if geometry is None:
+                return None
+            self._drag_data.calendar_geometry = geometry
 
+        (grid_x, grid_y, grid_width, grid_height), cell_bounds = geometry
         if not (
             grid_x <= x_root <= grid_x + grid_width
             and grid_y <= y_root <= grid_y + grid_height
         ):
             return None
 
-        for date_key, day_cell in self._day_cells.items():
-            frame = day_cell.frame
-            if not frame.winfo_viewable():
-                continue
-
-            cell_x = frame.winfo_rootx()
-            cell_y = frame.winfo_rooty()
-            cell_width = frame.winfo_width()
-            cell_height = frame.winfo_height()
-
+        for date_key, frame, cell_x, cell_y, cell_width, cell_height in cell_bounds:
             if (
                 cell_x <= x_root <= cell_x + cell_width
                 and cell_y <= y_root <= cell_y + cell_height
@@ -3290,6 +3817,50 @@ class YBSApp:
 
         return {"date_key": None, "day": None, "frame": None}
 
+    def _measure_calendar_geometry(self) -> CalendarGeometry | None:
+        try:
+            grid = self.calendar_grid
+            grid_bounds = (
+                grid.winfo_rootx(),
+                grid.winfo_rooty(),
+                grid.winfo_width(),
+                grid.winfo_height(),
+            )
+
+            cell_bounds = []
+            for date_key, day_cell in self._day_cells.items():
+                frame = day_cell.frame
+                if not frame.winfo_viewable():
+                    continue
+                cell_bounds.append(
+                    (
+                        date_key,
+                        frame,
+                        frame.winfo_rootx(),
+                        frame.winfo_rooty(),
+                        frame.winfo_width(),
+                        frame.winfo_height(),
+                    )
+                )
+        except tk.TclError:
+            return None
+
+        return grid_bounds, tuple(cell_bounds)
+
+    def _invalidate_calendar_geometry(self, event: tk.Event | None = None) -> None:
+        """Drop the calendar layout measured for the current drag."""
+
+        # Child widgets report <Configure> through the root binding as well.
+        # Hover styling resizes the widgets inside a cell on every cell the
+        # pointer enters, but only the window or the grid itself moving or
+        # resizing changes where the cells are.
+        if event is not None and getattr(event, "widget", None) not in (
+            self.root,
+            self.calendar_grid,
+        ):
+            return
+        self._drag_data.calendar_geometry = None
+
     def _update_calendar_hover(self, target_info: Dict[str, object] | None) -> None:
         if not target_info:
             self._remove_calendar_hover()
@@ -3318,18 +3889,15 @@ class YBSApp:
         hover_color = DAY_CELL_HOVER_VALID if is_valid else DAY_CELL_HOVER_INVALID
         border_color = "#1e90ff" if is_valid else FAIL_COLOR
 
-        day_cell.frame.configure(
+        self._configure_cell_widget(
+            day_cell.frame,
             bg=hover_color,
             highlightbackground=border_color,
             highlightcolor=border_color,
             highlightthickness=day_cell.border_thickness + 1,
         )
-        header_fg = (
-            TEXT_COLOR
-            if getattr(day_cell, "in_current_month", True)
-            else getattr(day_cell, "header_fg", ADJACENT_MONTH_TEXT_COLOR)
-        )
-        day_cell.header_label.configure(bg=hover_color, fg=header_fg)
+        header_fg = TEXT_COLOR if day_cell.in_current_month else day_cell.header_fg
+        self._configure_cell_widget(day_cell.header_label, bg=hover_color, fg=header_fg)
 
         self._calendar_hover = date_key
 
@@ -3365,7 +3933,7 @@ class YBSApp:
             if normalized_active is not None and key == normalized_active:
                 continue
 
-            orders_list = getattr(day_cell, "orders_list", None)
+            orders_list = day_cell.orders_list
             if orders_list is None:
                 continue
 
@@ -3405,7 +3973,8 @@ class YBSApp:
         self._tree_selection_anchor = None
 
     def _end_drag(self) -> None:
-        widget = self._drag_data.get("widget")
+        self._cancel_drag_motion()
+        widget = self._drag_data.widget
         if widget is not None:
             try:  # pragma: no cover - defensive cleanup
                 widget.destroy()
@@ -3462,12 +4031,6 @@ class YBSApp:
             except (TypeError, ValueError):
                 normalized_source = None
 
-        target_snapshot = self._capture_assignments_state(normalized_key)
-        source_snapshot: dict[str, Any] | None = (
-            self._capture_assignments_state(normalized_source)
-            if normalized_source is not None
-            else None
-        )
         deselect_after_cross_day_move = (
             source_kind == "calendar"
             and normalized_source is not None
@@ -3530,6 +4093,7 @@ class YBSApp:
                     index_hints.append(None)
 
         removed_indices: list[int] = []
+        removed_entries: list[Tuple[int, Tuple[str, str]]] = []
         removed_from_source = False
         if normalized_source is not None and source_assignments_ref:
             assignments_list = source_assignments_ref
@@ -3558,7 +4122,8 @@ class YBSApp:
             if removed_indices:
                 for idx in sorted(removed_indices, reverse=True):
                     if 0 <= idx < len(assignments_list):
-                        assignments_list.pop(idx)
+                        removed_entries.append((idx, assignments_list.pop(idx)))
+                removed_entries.reverse()
                 removed_from_source = True
                 if normalized_source != normalized_key:
                     if assignments_list:
@@ -3567,6 +4132,7 @@ class YBSApp:
                         self._calendar_assignments.pop(normalized_source, None)
 
         added_to_target = False
+        added_entries: list[Tuple[int, Tuple[str, str]]] = []
         target_indices: list[int] = []
         for order in normalized_orders:
             if order in target_assignments:
@@ -3575,6 +4141,7 @@ class YBSApp:
                 target_assignments.append(order)
                 added_to_target = True
                 index = len(target_assignments) - 1
+                added_entries.append((index, order))
             target_indices.append(index)
 
         removed_sorted = sorted(removed_indices)
@@ -3641,8 +4208,7 @@ class YBSApp:
                 return
             listbox.selection_clear(0, tk.END)
             valid_indices = [idx for idx in indices if 0 <= idx < size]
-            for idx in valid_indices:
-                listbox.selection_set(idx)
+            self._select_listbox_indices(listbox, valid_indices)
             if valid_indices:
                 anchor_index = valid_indices[-1]
                 try:
@@ -3657,22 +4223,30 @@ class YBSApp:
 
         self._clear_other_day_selections(normalized_key)
 
-        undo_entries: dict[DateKey, dict[str, Any]] = {}
-        if added_to_target or (
-            removed_from_source and normalized_source == normalized_key
-        ):
-            undo_entries[normalized_key] = dict(target_snapshot)
-        if removed_from_source and (
-            normalized_source is not None and normalized_source != normalized_key
-        ):
-            entry_snapshot = source_snapshot or {"had_key": False, "previous": None}
-            undo_entries[normalized_source] = dict(entry_snapshot)
+        undo_entries: dict[DateKey, AssignmentsDiff] = {}
+        if normalized_source == normalized_key:
+            if removed_entries or added_entries:
+                undo_entries[normalized_key] = AssignmentsDiff(
+                    removed=removed_entries, added=added_entries
+                )
+        else:
+            if added_entries:
+                undo_entries[normalized_key] = AssignmentsDiff(
+                    removed=[], added=added_entries
+                )
+            if removed_entries and normalized_source is not None:
+                undo_entries[normalized_source] = AssignmentsDiff(
+                    removed=removed_entries, added=[]
+                )
 
         if undo_entries:
-            self._push_undo_action({"kind": "assignments", "dates": undo_entries})
+            self._push_undo_action(AssignmentsAction(dates=undo_entries))
 
         if added_to_target or removed_from_source:
-            self._schedule_state_save()
+            changed_keys = [normalized_key]
+            if normalized_source is not None and normalized_source != normalized_key:
+                changed_keys.append(normalized_source)
+            self._schedule_state_save(*changed_keys)
 
     def _assign_order_to_day(
         self,
@@ -3683,7 +4257,6 @@ class YBSApp:
     ) -> bool:
         normalized = self._normalize_assignment(order_values)
 
-        snapshot = self._capture_assignments_state(date_key)
         assignments = self._calendar_assignments.setdefault(date_key, [])
 
         if normalized in assignments:
@@ -3692,24 +4265,50 @@ class YBSApp:
 
         if push_undo:
             self._push_undo_action(
-                {"kind": "assignments", "dates": {date_key: snapshot}}
+                AssignmentsAction(
+                    dates={
+                        date_key: AssignmentsDiff(
+                            removed=[], added=[(len(assignments), normalized)]
+                        )
+                    }
+                )
             )
 
         assignments.append(normalized)
         self._update_day_cell_display(date_key)
-        self._schedule_state_save()
+        self._schedule_state_save(date_key)
         return True
 
+    def _queue_day_cell_display(self, date_key: DateKey) -> None:
+        """Refresh a day cell on the next idle pass, once per batch of edits."""
+
+        self._pending_display_updates.add(date_key)
+        if self._display_flush_after_id is not None:
+            return
+        try:
+            self._display_flush_after_id = self.root.after_idle(
+                self._flush_day_cell_displays
+            )
+        except tk.TclError:
+            self._flush_day_cell_displays()
+
+    def _flush_day_cell_displays(self) -> None:
+        self._display_flush_after_id = None
+        pending = self._pending_display_updates
+        self._pending_display_updates = set()
+        for date_key in pending:
+            self._update_day_cell_display(date_key)
+
     def _update_day_cell_display(self, date_key: DateKey) -> None:
         day_cell = self._day_cells.get(date_key)
         if not day_cell:
             return
 
-        assignments = self._calendar_assignments.get(date_key, [])
+        assignments = self._calendar_assignments.get(date_key) or ()
         orders_list = day_cell.orders_list
         orders_list.delete(0, tk.END)
-        for assignment in assignments:
-            orders_list.insert(tk.END, self._format_assignment_label(assignment))
+        # One Tcl command for the whole list rather than one per order.
+        orders_list.insert(tk.END, *map(self._format_assignment_label, assignments))
 
         try:
             day_value = int(date_key[2])
@@ -3721,10 +4320,14 @@ class YBSApp:
             else:
                 day_text = str(day_value)
 
-        day_cell.header_label.configure(text=day_text)
+        self._configure_cell_widget(day_cell.header_label, text=day_text)
         self._apply_day_cell_base_style(date_key)
 
-    def _format_assignment_label(self, assignment: Tuple[str, str]) -> str:
+    # Listboxes are refilled wholesale on every change; labels depend only on
+    # the (order, company) pair, so they are memoized.
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_assignment_label(assignment: Tuple[str, str]) -> str:
         order_number = assignment[0].strip()
         company = assignment[1].strip()
         if order_number and company:
@@ -3735,7 +4338,11 @@ class YBSApp:
             return company
         return "Unnamed order"
 
-    def _format_date_label(self, date_key: DateKey) -> str:
+    # Labels are rebuilt for every status message; a day's label never
+    # changes, so the strftime result is memoized.
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_date_label(date_key: DateKey) -> str:
         try:
             year, month, day = (int(date_key[0]), int(date_key[1]), int(date_key[2]))
             display_date = dt.date(year, month, day)
@@ -3917,6 +4524,10 @@ class YBSApp:
                     message = str(event[2]) if len(event) > 2 else ""
                     payload = event[3] if len(event) > 3 else None
                     self._handle_calendar_drop(success, message, payload)
+                    continue
+
+                if event_type == "state_saved":
+                    self._on_state_saved()
         except queue.Empty:
             pass
         finally:
@@ -3955,9 +4566,10 @@ class YBSApp:
 
         self._tree_selection_anchor = None
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if self._tree_children:
+            self.tree.delete(*self._tree_children)
 
+        children: list[str] = []
         for order in self._all_orders:
             order_number = str(getattr(order, "order_number", ""))
             company = str(getattr(order, "company", ""))
@@ -3965,7 +4577,12 @@ class YBSApp:
                 filter_text in order_number.lower() or filter_text in company.lower()
             ):
                 continue
-            self.tree.insert("", tk.END, values=(order_number, company))
+            children.append(
+                self.tree.insert("", tk.END, values=(order_number, company))
+            )
+
+        self._tree_children = tuple(children)
+        self._tree_child_index = {item: index for index, item in enumerate(children)}
 
 
 def launch_app() -> None: